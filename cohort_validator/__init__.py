@@ -8,10 +8,10 @@ The main functionality is provided through the CohortValidator class, which allo
 you to validate cohort expressions and receive detailed warnings and errors.
 """
 
-from .cohort_validator import CohortValidator
+from .cohort_validator import FAST_START_JVM_ARGS, CohortValidator
 
 __version__ = "1.0.0"
 __author__ = "Numan Burak Fidan"
 __email__ = "numanburak_fidan@epam.com"
 
-__all__ = ["CohortValidator"]
+__all__ = ["CohortValidator", "FAST_START_JVM_ARGS"]
@@ -3,12 +3,20 @@ Command-line interface for Cohort Validator.
 """
 
 import argparse
-import json
+import io
+import os
+import signal
+import socket
+import socketserver
+import stat
 import sys
+import threading
 from pathlib import Path
 from typing import Any, Dict
 
-from .cohort_validator import CohortValidator
+import orjson
+
+from .cohort_validator import FAST_START_JVM_ARGS, CohortValidator, _detach_thread
 
 
 def main():
@@ -17,7 +25,10 @@ def main():
         description="Validate cohort expressions using OHDSI CIRCE library"
     )
     parser.add_argument(
-        "input_file", type=str, help="Path to JSON file containing cohort expression"
+        "input_file",
+        type=str,
+        nargs="?",
+        help="Path to JSON file containing cohort expression",
     )
     parser.add_argument(
         "--output", "-o", type=str, help="Output file path (default: stdout)"
@@ -40,8 +51,42 @@ def main():
         help="Path to CIRCE dependencies directory (auto-detected if not provided)",
     )
 
+    parser.add_argument(
+        "--serve",
+        metavar="SOCKET",
+        type=str,
+        help="Keep the JVM running and validate cohorts sent as JSON lines "
+        "to this UNIX socket",
+    )
+    parser.add_argument(
+        "--client",
+        metavar="SOCKET",
+        type=str,
+        help="Validate the input file through a validator started with --serve",
+    )
+
     args = parser.parse_args()
 
+    # Initialize validator arguments
+    validator_kwargs = {}
+    if args.jar_path:
+        validator_kwargs["jar_path"] = args.jar_path
+    if args.deps_path:
+        validator_kwargs["deps_path"] = args.deps_path
+    if args.client:
+        validator_kwargs["socket_path"] = args.client
+
+    if args.serve:
+        try:
+            serve(args.serve, CohortValidator(**validator_kwargs))
+        except (OSError, RuntimeError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if not args.input_file:
+        parser.error("input_file is required unless --serve is given")
+
     try:
         # Load cohort expression from file
         input_path = Path(args.input_file)
@@ -49,20 +94,15 @@ def main():
             print(f"Error: Input file '{args.input_file}' not found", file=sys.stderr)
             sys.exit(1)
 
-        with open(input_path, "r", encoding="utf-8") as f:
-            cohort_data = json.load(f)
-
-        # Initialize validator
-        validator_kwargs = {}
-        if args.jar_path:
-            validator_kwargs["jar_path"] = args.jar_path
-        if args.deps_path:
-            validator_kwargs["deps_path"] = args.deps_path
+        with open(input_path, "rb") as f:
+            cohort_data = orjson.loads(f.read())
 
-        validator = CohortValidator(**validator_kwargs)
-
-        # Validate cohort
-        warnings, errors = validator.validate_cohort(cohort_data)
+        # Validate cohort; malformed input is reported without starting the
+        # JVM or contacting the server
+        with CohortValidator(
+            jvm_args=FAST_START_JVM_ARGS, **validator_kwargs
+        ) as validator:
+            warnings, errors = validator.validate_cohort(cohort_data)
 
         # Prepare output
         result = {
@@ -78,7 +118,7 @@ def main():
 
         # Output results
         if args.format == "json":
-            output = json.dumps(result, indent=2)
+            output = orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
         else:
             output = format_text_output(result)
 
@@ -96,37 +136,131 @@ def main():
         sys.exit(1)
 
 
+def serve(socket_path: str, validator: CohortValidator):
+    """
+    Validate cohorts received on a UNIX socket until interrupted or
+    terminated.
+
+    Each request is one cohort expression as a single line of JSON; each
+    response is one line of JSON with "warnings" and "errors" lists. A
+    request that is a JSON array of expressions as strings is validated as a
+    batch and answered with an array of such results. Connections are served
+    in parallel, and the JVM is started once, before the first request
+    arrives.
+    """
+
+    class ValidationHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            try:
+                for line in self.rfile:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    if line.startswith(b"["):
+                        response = [
+                            {"warnings": warnings, "errors": errors}
+                            for warnings, errors in validator.validate_cohorts(
+                                orjson.loads(line)
+                            )
+                        ]
+                    else:
+                        warnings, errors = validator.validate_cohort(line)
+                        response = {"warnings": warnings, "errors": errors}
+                    self.wfile.write(orjson.dumps(response) + b"\n")
+            finally:
+                # Every connection has its own thread
+                _detach_thread()
+
+    _remove_stale_socket(socket_path)
+
+    # Start the JVM before accepting requests
+    try:
+        validator.checker
+    except BaseException:
+        validator.shutdown()
+        raise
+
+    # Stop on SIGTERM as on Ctrl-C, so the socket is removed and the JVM
+    # shut down. Set after starting the JVM, which installs a SIGTERM handler
+    # of its own; signal handlers can only be set from the main thread
+    in_main_thread = threading.current_thread() is threading.main_thread()
+    if in_main_thread:
+        previous_handler = signal.signal(signal.SIGTERM, _interrupt)
+    try:
+        with _ValidationServer(socket_path, ValidationHandler) as server:
+            # Only a socket this server bound is removed; if binding fails,
+            # whatever is at the path is left alone
+            try:
+                print(f"Serving cohort validation on {socket_path}", file=sys.stderr)
+                server.serve_forever()
+            finally:
+                os.unlink(socket_path)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        validator.shutdown()
+        if in_main_thread:
+            signal.signal(signal.SIGTERM, previous_handler)
+
+
+class _ValidationServer(socketserver.ThreadingUnixStreamServer):
+    # Clients that stay connected do not keep the server from exiting
+    daemon_threads = True
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def _remove_stale_socket(socket_path: str):
+    """
+    Remove a socket left behind by a server that is no longer running.
+
+    Anything else at the path is left alone, so binding to it fails.
+
+    Raises:
+        RuntimeError: If a server still accepts connections on the socket
+    """
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        return
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            # Nobody is listening
+            os.unlink(socket_path)
+            return
+    raise RuntimeError(f"A validation server is already running on {socket_path}")
+
+
 def format_text_output(result: Dict[str, Any]) -> str:
     """Format validation results as human-readable text."""
-    lines = []
-    lines.append(f"Validation Results for: {result['input_file']}")
-    lines.append("=" * 50)
+    buf = io.StringIO()
+    buf.write(f"Validation Results for: {result['input_file']}\n")
+    buf.write("=" * 50 + "\n")
 
     summary = result["summary"]
-    lines.append(f"Total Warnings: {summary['total_warnings']}")
-    lines.append(f"Total Errors: {summary['total_errors']}")
-    lines.append(f"Valid: {'Yes' if summary['is_valid'] else 'No'}")
-    lines.append("")
-
-    if result["warnings"]:
-        lines.append("WARNINGS:")
-        lines.append("-" * 20)
-        for i, warning in enumerate(result["warnings"], 1):
-            lines.append(
-                f"{i}. [{warning.get('severity', 'UNKNOWN')}] {warning.get('message', 'No message')}"
-            )
-        lines.append("")
-
-    if result["errors"]:
-        lines.append("ERRORS:")
-        lines.append("-" * 20)
-        for i, error in enumerate(result["errors"], 1):
-            lines.append(
-                f"{i}. [{error.get('severity', 'UNKNOWN')}] {error.get('message', 'No message')}"
-            )
-        lines.append("")
-
-    return "\n".join(lines)
+    buf.write(f"Total Warnings: {summary['total_warnings']}\n")
+    buf.write(f"Total Errors: {summary['total_errors']}\n")
+    buf.write(f"Valid: {'Yes' if summary['is_valid'] else 'No'}\n")
+
+    for title, items in (
+        ("WARNINGS", result["warnings"]),
+        ("ERRORS", result["errors"]),
+    ):
+        if not items:
+            continue
+        buf.write(f"\n{title}:\n")
+        buf.write("-" * 20 + "\n")
+        for i, item in enumerate(items, 1):
+            buf.write(f"{i}. [{item['severity']}] {item['message']}\n")
+
+    return buf.getvalue()
 
 
 if __name__ == "__main__":
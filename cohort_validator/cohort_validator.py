@@ -13,14 +13,115 @@ Usage:
     warnings, errors = validator.validate_cohort(cohort_data_dict)
 """
 
-import json
+import glob
+import hashlib
+import logging
 import os
-from typing import Any, Dict, List, Tuple
+import socket
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import jpype
 import jpype.imports
+import orjson
 from jpype.types import *
 
+log = logging.getLogger(__name__)
+
+# Severities reported as errors rather than warnings
+_ERROR_SEVERITIES = frozenset({"CRITICAL", "ERROR"})
+
+# Number of distinct cohort expressions whose results are kept in memory
+VALIDATION_CACHE_SIZE = 128
+
+# The CIRCE JAR and its dependencies ship in the package's target directory;
+# resolved once at import time rather than for every validator instance
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_JAR_PATH = os.path.join(_PACKAGE_DIR, "target", "circe-1.13.0-SNAPSHOT.jar")
+DEFAULT_DEPENDENCIES_PATH = os.path.join(_PACKAGE_DIR, "target", "dependencies")
+
+# JVM options for short-lived processes such as a single CLI run or a test
+# session: compiling with C1 only starts faster, and for validation workloads
+# was measured to stay faster over thousands of cohorts as well
+FAST_START_JVM_ARGS = ("-XX:TieredStopAtLevel=1",)
+
+# Number of checks validate_cohorts runs at once by default, as for a
+# ThreadPoolExecutor
+_DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Serializes starting the JVM and loading the CIRCE classes, which the first
+# validations may do from several threads at once
+_JVM_LOCK = threading.Lock()
+
+# Checker instances shared by all validators, keyed by JAR and dependencies
+# path; Checker keeps no state between calls, so one instance can serve all
+_CHECKER_CACHE: Dict[Tuple[str, str], Any] = {}
+
+# Top-level keys without which the Checker fails with a NullPointerException;
+# other keys, such as InclusionRules, default to empty
+_REQUIRED_KEYS = ("ConceptSets", "PrimaryCriteria")
+
+
+def structure_error(cohort_json: Any) -> Optional[Dict[str, Any]]:
+    """
+    Return an error for a cohort expression dictionary CIRCE cannot check.
+
+    Only dictionaries are inspected; JSON text is left for the JVM to parse.
+    An expression without ConceptSets or PrimaryCriteria makes the Checker
+    fail with a NullPointerException, so it is rejected without starting the
+    JVM.
+
+    Returns:
+        Error dictionary, or None if the expression may be validated
+    """
+    if not isinstance(cohort_json, dict):
+        return None
+    missing = [key for key in _REQUIRED_KEYS if cohort_json.get(key) is None]
+    if missing:
+        return {
+            "message": f"Cohort expression has no {' and '.join(missing)}",
+            "severity": "CRITICAL",
+            "type": "SCHEMA_ERROR",
+        }
+    return None
+
+
+def _detach_thread():
+    """
+    Detach the calling thread from the JVM, if it is attached.
+
+    JPype attaches every thread that calls into Java, and keeps it attached
+    until the thread detaches itself; threads that end without doing so
+    leave their Java thread objects behind.
+    """
+    if jpype.isJVMStarted():
+        thread_class = jpype.JClass("java.lang.Thread")
+        if thread_class.isAttached():
+            thread_class.detach()
+
+
+def _copy_result(
+    warnings: List[Dict[str, Any]], errors: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Copy a validation result down to its dictionaries.
+
+    Cached results are handed out as copies, so that callers modifying what
+    they get back cannot change what later calls return.
+    """
+    return [dict(w) for w in warnings], [dict(e) for e in errors]
+
+
+def _cache_dir() -> str:
+    """Return the per-user cache directory for the cohort validator."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "cohort_validator")
+
 
 class CohortValidator:
     """
@@ -30,131 +131,231 @@ class CohortValidator:
     using the Java CIRCE library via JPype1.
     """
 
-    def __init__(self, jar_path: str = None):
+    def __init__(
+        self,
+        jar_path: str = None,
+        deps_path: str = None,
+        socket_path: str = None,
+        jvm_args: Sequence[str] = (),
+    ):
         """
         Initialize the cohort validator.
 
+        The JVM is not started here; it is started and the CIRCE classes are
+        loaded on first use of the ``checker`` property.
+
         Args:
             jar_path: Path to the CIRCE JAR file. If None, uses default path.
+            deps_path: Path to the directory of CIRCE dependency JARs. If
+                None, uses default path.
+            socket_path: UNIX socket of a validator started with
+                ``cohort-validate --serve``. If given, cohorts are validated
+                by that server and no JVM is started in this process.
+            jvm_args: Extra options for the JVM, such as FAST_START_JVM_ARGS.
+                Ignored if the JVM is already running.
         """
         self._jvm_started = False
         self._jar_path = jar_path or self._get_default_jar_path()
-        self._dependencies_path = self._get_dependencies_path()
+        self._dependencies_path = deps_path or self._get_dependencies_path()
+        self._socket_path = socket_path
+        self._jvm_args = tuple(jvm_args)
         self._checker = None
+        self._mapper = None
         self._cohort_expression_class = None
+        self._cohort_expression_array_class = None
         self._warning_class = None
         self._warning_severity_class = None
-
-        self._start_jvm()
-        self._load_classes()
+        self._warning_list_array_class = None
+        self._as_list = None
+        self._warnings_writer = None
+        self._warning_batches_writer = None
+        self._cache = OrderedDict()
+        # Guards the cache, which server threads share
+        self._cache_lock = threading.Lock()
+
+    @property
+    def checker(self):
+        """The CIRCE Checker, starting the JVM and loading classes on first use."""
+        if self._checker is None:
+            with _JVM_LOCK:
+                if self._checker is None:
+                    self._start_jvm()
+                    self._load_classes()
+        return self._checker
 
     def _get_default_jar_path(self) -> str:
         """Get the default path to the CIRCE JAR file."""
-        # Get the package directory
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-
-        # JAR file is now located in the package's target directory
-        jar_path = os.path.join(current_dir, "target", "circe-1.13.0-SNAPSHOT.jar")
-        abs_path = os.path.abspath(jar_path)
-
-        return abs_path
+        return DEFAULT_JAR_PATH
 
     def _get_dependencies_path(self) -> str:
-        """Get the path to the dependencies directory."""
-        # Get the package directory
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-
-        # Dependencies directory is now located in the package's target directory
-        deps_path = os.path.join(current_dir, "target", "dependencies")
-        abs_path = os.path.abspath(deps_path)
-
-        return abs_path
+        """Get the default path to the dependencies directory."""
+        return DEFAULT_DEPENDENCIES_PATH
 
     def _start_jvm(self):
         """Start the JVM and load the CIRCE library."""
         if self._jvm_started:
             return
 
-        # Get all JAR files
-        jar_files = [self._jar_path]
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "CIRCE JAR: %s (exists: %s)",
+                self._jar_path,
+                os.path.exists(self._jar_path),
+            )
+            log.debug(
+                "CIRCE dependencies: %s (exists: %s)",
+                self._dependencies_path,
+                os.path.exists(self._dependencies_path),
+            )
 
-        # Add all dependency JAR files
-        if os.path.exists(self._dependencies_path):
-            for file in os.listdir(self._dependencies_path):
-                if file.endswith(".jar"):
-                    jar_files.append(os.path.join(self._dependencies_path, file))
+        # Start JVM; only the instance that starts it is responsible for it
+        if not jpype.isJVMStarted():
+            jpype.startJVM(*self._jvm_args, classpath=self._build_classpath())
+            self._jvm_started = True
+            # A thread other than the main thread that started the JVM stays
+            # attached to it, and shutting down the JVM then never returns
+            if threading.current_thread() is not threading.main_thread():
+                _detach_thread()
+
+    def _build_classpath(self) -> str:
+        """
+        Build the JVM classpath from the CIRCE JAR and its dependencies.
 
-        # Create classpath
-        classpath = ":".join(jar_files)
+        The dependency listing is cached on disk together with the
+        modification time of the dependencies directory, so it is only
+        rescanned when JAR files are added or removed.
+        """
+        if not os.path.isdir(self._dependencies_path):
+            return self._jar_path
 
-        # Start JVM
-        if not jpype.isJVMStarted():
-            jpype.startJVM(classpath=classpath)
+        mtime_ns = os.stat(self._dependencies_path).st_mtime_ns
+        header = f"{self._dependencies_path}\t{mtime_ns}"
+        cache_file = os.path.join(_cache_dir(), "classpath.txt")
 
-        self._jvm_started = True
+        dependencies = None
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                if f.readline().rstrip("\n") == header:
+                    dependencies = f.readline().rstrip("\n")
+        except OSError:
+            pass
+
+        if dependencies is None:
+            dependencies = os.pathsep.join(
+                sorted(glob.glob(os.path.join(self._dependencies_path, "*.jar")))
+            )
+            try:
+                cache_dir = os.path.dirname(cache_file)
+                os.makedirs(cache_dir, exist_ok=True)
+                # Written to a temporary file and renamed over the cache, so
+                # that a process reading it never sees a partial file
+                fd, temp_file = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        f.write(f"{header}\n{dependencies}\n")
+                    os.replace(temp_file, cache_file)
+                except OSError:
+                    os.unlink(temp_file)
+                    raise
+            except OSError:
+                pass
+
+        if not dependencies:
+            return self._jar_path
+        return os.pathsep.join([self._jar_path, dependencies])
 
     def _load_classes(self):
         """Load the necessary Java classes."""
         try:
             # Import the main classes
+            from java.util import Arrays
+            from java.util import List as JavaList
+            from org.ohdsi.analysis import Utils
             from org.ohdsi.circe.check import Checker, Warning, WarningSeverity
             from org.ohdsi.circe.cohortdefinition import CohortExpression
 
-            self._checker = Checker()
+            key = (self._jar_path, self._dependencies_path)
+            checker = _CHECKER_CACHE.get(key)
+            if checker is None:
+                checker = _CHECKER_CACHE[key] = Checker()
+            # CohortExpression.fromJson() deserializes with this mapper, but
+            # Utils only exposes it through a private accessor
+            get_mapper = Utils.class_.getDeclaredMethod("getObjectMapper")
+            get_mapper.setAccessible(True)
+            self._mapper = get_mapper.invoke(None)
             self._cohort_expression_class = CohortExpression
+            self._cohort_expression_array_class = jpype.JArray(CohortExpression)
             self._warning_class = Warning
             self._warning_severity_class = WarningSeverity
+            self._warning_list_array_class = jpype.JArray(JavaList)
+            self._as_list = Arrays.asList
+
+            # Typed writers so Jackson includes each warning's "type" property
+            type_factory = self._mapper.getTypeFactory()
+            warnings_type = type_factory.constructCollectionType(
+                JavaList.class_, Warning.class_
+            )
+            self._warnings_writer = self._mapper.writerFor(warnings_type)
+            self._warning_batches_writer = self._mapper.writerFor(
+                type_factory.constructCollectionType(JavaList.class_, warnings_type)
+            )
+            # Set last: once the checker is set, the rest may be used
+            self._checker = checker
 
         except Exception as e:
             raise RuntimeError(f"Failed to load Java classes: {e}")
 
     def validate_cohort(
-        self, cohort_json: dict
+        self, cohort_json: Union[dict, str, bytes]
     ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
-        Validate a cohort expression dictionary.
+        Validate a cohort expression.
+
+        JSON text passed as ``str`` or ``bytes`` is handed to the JVM as is;
+        only dictionaries are serialized. Results are cached by a hash of
+        that JSON (key-sorted for dictionaries), so validating an identical
+        expression again does not reach the JVM.
 
         Args:
-            cohort_json: Dictionary representing the cohort expression
+            cohort_json: Dictionary representing the cohort expression, or
+                the expression as JSON text
 
         Returns:
             Tuple of (warnings, errors) where each is a list of dictionaries
-            containing validation results
+            containing validation results. Every dictionary has exactly the
+            keys ``message``, ``severity`` and ``type``.
         """
+        error = structure_error(cohort_json)
+        if error is not None:
+            return [], [error]
+
         try:
-            # Create CohortExpression from JSON
-            cohort_expression = self._cohort_expression_class.fromJson(
-                json.dumps(cohort_json)
-            )
+            # The encoded payload doubles as the cache key and the Java input
+            payload = self._encode(cohort_json)
+            cache_key = hashlib.blake2b(payload).digest()
 
-            # Run validation
-            java_warnings = self._checker.check(cohort_expression)
-
-            # Convert Java warnings to Python dictionaries
-            warnings = []
-            errors = []
-
-            for java_warning in java_warnings:
-                warning_dict = {
-                    "message": str(java_warning.toMessage()),
-                    "severity": (
-                        str(java_warning.getSeverity())
-                        if hasattr(java_warning, "getSeverity")
-                        else "UNKNOWN"
-                    ),
-                    "type": str(java_warning.getClass().getSimpleName()),
-                }
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                return cached
 
-                # Categorize as warning or error based on severity
-                severity = warning_dict["severity"].upper()
-                if severity in ["CRITICAL", "ERROR"]:
-                    errors.append(warning_dict)
-                else:
-                    warnings.append(warning_dict)
+            if self._socket_path is not None:
+                warnings, errors = self._request_validation(payload)
+            else:
+                checker = self.checker
 
-            return warnings, errors
+                # Create CohortExpression from UTF-8 encoded JSON
+                cohort_expression = self._read_value(
+                    payload, self._cohort_expression_class
+                )
 
-        except json.JSONDecodeError as e:
+                # Run validation
+                java_warnings = checker.check(cohort_expression)
+                warnings, errors = self._convert_warnings(java_warnings)
+
+            self._cache_result(cache_key, (warnings, errors))
+            return _copy_result(warnings, errors)
+
+        except orjson.JSONEncodeError as e:
             return [], [
                 {
                     "message": f"Invalid JSON: {e}",
@@ -163,13 +364,299 @@ class CohortValidator:
                 }
             ]
         except Exception as e:
-            return [], [
-                {
-                    "message": f"Validation error: {e}",
-                    "severity": "CRITICAL",
-                    "type": "VALIDATION_ERROR",
-                }
-            ]
+            return [], [self._validation_error(e)]
+
+    def validate_cohorts(
+        self,
+        cohorts: Iterable[Union[dict, str, bytes]],
+        max_workers: Optional[int] = None,
+    ) -> List[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        Validate several cohort expressions in one batch.
+
+        All expressions are sent to the JVM as a single JSON array and
+        deserialized with one call, instead of one parse per cohort. If the
+        array cannot be deserialized as a whole, or JSON text holds more than
+        one expression, each cohort is validated on its own so the failure is
+        reported against the right entry.
+
+        Results share the cache of ``validate_cohort``: cached expressions
+        are not validated again, an expression repeated within the batch is
+        validated once, and new results are added to the cache.
+
+        The checks run concurrently on a thread pool. JPype releases the GIL
+        while a Java method runs and the CIRCE Checker keeps no state between
+        calls, so the checks execute in parallel inside the JVM. With a
+        ``socket_path``, the cohorts are instead sent to the server together
+        in one request.
+
+        Args:
+            cohorts: Iterable of cohort expressions, as dictionaries or JSON text
+            max_workers: Number of checks to run at once. If None, uses the
+                ThreadPoolExecutor default.
+
+        Returns:
+            List of (warnings, errors) tuples, in the same order as the input
+        """
+        cohorts = list(cohorts)
+        results = [None] * len(cohorts)
+
+        # Expressions rejected up front are not sent to the JVM at all, nor
+        # are cached ones; repeats within the batch are checked only once
+        indices = []
+        payloads = []
+        cache_keys = {}
+        repeats = {}
+        first_index = {}
+        for index, cohort in enumerate(cohorts):
+            error = structure_error(cohort)
+            if error is not None:
+                results[index] = ([], [error])
+                continue
+            try:
+                payload = self._encode(cohort)
+            except orjson.JSONEncodeError:
+                results[index] = self.validate_cohort(cohort)
+                continue
+            cache_key = hashlib.blake2b(payload).digest()
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                results[index] = cached
+            elif cache_key in first_index:
+                repeats[index] = first_index[cache_key]
+            else:
+                first_index[cache_key] = index
+                indices.append(index)
+                payloads.append(payload)
+                cache_keys[index] = cache_key
+        if not indices:
+            return results
+
+        if self._socket_path is not None:
+            try:
+                responses = self._request_validations(payloads)
+            except Exception:
+                return self._validate_each(cohorts, indices, repeats, results)
+            for index, (warnings, errors) in zip(indices, responses):
+                self._cache_result(cache_keys[index], (warnings, errors))
+                results[index] = _copy_result(warnings, errors)
+            return self._fill_repeats(repeats, results)
+
+        try:
+            checker = self.checker
+            cohort_expressions = self._read_value(
+                b"[" + b",".join(payloads) + b"]",
+                self._cohort_expression_array_class,
+            )
+            # JSON text such as '{...},{...}' adds elements to the array,
+            # which would shift every later result onto the wrong cohort
+            if len(cohort_expressions) != len(indices):
+                raise ValueError("Cohort expressions do not match the batch")
+        except Exception:
+            return self._validate_each(cohorts, indices, repeats, results)
+
+        # Each worker checks every n-th expression in a single task, so it
+        # can detach from the JVM once done instead of leaving a Java thread
+        # behind for every pool thread of every batch
+        cohort_expressions = list(cohort_expressions)
+        workers = min(max_workers or _DEFAULT_WORKERS, len(cohort_expressions))
+
+        def check_stripe(start):
+            try:
+                stripe = []
+                for cohort_expression in cohort_expressions[start::workers]:
+                    try:
+                        stripe.append((checker.check(cohort_expression), None))
+                    except Exception as e:
+                        stripe.append((None, e))
+                return stripe
+            finally:
+                _detach_thread()
+
+        outcomes = [None] * len(cohort_expressions)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for start, stripe in enumerate(pool.map(check_stripe, range(workers))):
+                outcomes[start::workers] = stripe
+
+        checked = []
+        for index, (java_warnings, error) in zip(indices, outcomes):
+            if error is None:
+                checked.append((index, java_warnings))
+            else:
+                results[index] = ([], [self._validation_error(error)])
+
+        if checked:
+            # Serialize the warnings of every cohort with a single JVM call;
+            # the lists are block-copied into a Java array and wrapped as a
+            # List rather than appended to an ArrayList one at a time
+            java_batches = self._as_list(
+                self._warning_list_array_class([w for _, w in checked])
+            )
+            batches = self._write_json(self._warning_batches_writer, java_batches)
+            for (index, _), batch in zip(checked, batches):
+                warnings, errors = self._split_warnings(batch)
+                self._cache_result(cache_keys[index], (warnings, errors))
+                results[index] = _copy_result(warnings, errors)
+
+        return self._fill_repeats(repeats, results)
+
+    def _validate_each(
+        self,
+        cohorts: List[Union[dict, str, bytes]],
+        indices: List[int],
+        repeats: Dict[int, int],
+        results: List[Any],
+    ) -> List[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """Validate the cohorts of a failed batch one at a time."""
+        for index in indices:
+            results[index] = self.validate_cohort(cohorts[index])
+        for index, first in repeats.items():
+            results[index] = self.validate_cohort(cohorts[first])
+        return results
+
+    @staticmethod
+    def _fill_repeats(
+        repeats: Dict[int, int], results: List[Any]
+    ) -> List[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """Give each repeated cohort a copy of the result of its first occurrence."""
+        for index, first in repeats.items():
+            warnings, errors = results[first]
+            results[index] = _copy_result(warnings, errors)
+        return results
+
+    def _cached_result(
+        self, cache_key: bytes
+    ) -> Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """Return a copy of a cached result, if it is cached."""
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is None:
+                return None
+            self._cache.move_to_end(cache_key)
+        return _copy_result(*cached)
+
+    def _cache_result(
+        self,
+        cache_key: bytes,
+        result: Tuple[List[Dict[str, Any]], List[Dict[str, Any]]],
+    ):
+        """Cache a result, evicting the least recently used one when full."""
+        with self._cache_lock:
+            self._cache[cache_key] = result
+            if len(self._cache) > VALIDATION_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _encode(cohort_json: Union[dict, str, bytes]) -> bytes:
+        """Return a cohort expression as UTF-8 JSON, serializing only dicts."""
+        if isinstance(cohort_json, (bytes, bytearray)):
+            return bytes(cohort_json)
+        if isinstance(cohort_json, str):
+            return cohort_json.encode("utf-8")
+        return orjson.dumps(cohort_json, option=orjson.OPT_SORT_KEYS)
+
+    def _request_validation(
+        self, payload: bytes
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Validate UTF-8 encoded JSON through a ``cohort-validate --serve`` server."""
+        # The server reads one expression per line
+        if b"\n" in payload:
+            payload = orjson.dumps(orjson.loads(payload))
+
+        response = self._send_request(payload)
+        return response["warnings"], response["errors"]
+
+    def _request_validations(
+        self, payloads: List[bytes]
+    ) -> List[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        Validate several UTF-8 encoded expressions with one server request.
+
+        The expressions are sent as a JSON array of strings, which the server
+        validates as a batch, and answered with an array of results.
+        """
+        responses = self._send_request(
+            orjson.dumps([payload.decode("utf-8") for payload in payloads])
+        )
+        if len(responses) != len(payloads):
+            raise ValueError("Validation server returned the wrong number of results")
+        return [(response["warnings"], response["errors"]) for response in responses]
+
+    def _send_request(self, line: bytes) -> Any:
+        """Send one JSON line to the validation server and parse its answer."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self._socket_path)
+            sock.sendall(line + b"\n")
+            with sock.makefile("rb") as f:
+                return orjson.loads(f.readline())
+
+    def _read_value(self, payload: bytes, java_class):
+        """
+        Deserialize UTF-8 encoded JSON into an instance of a Java class.
+
+        The payload crosses into the JVM as a byte[] and is parsed by Jackson
+        directly, avoiding the UTF-16 String copy that fromJson() requires.
+        """
+        return self._mapper.readValue(
+            jpype.JArray(jpype.JByte)(payload), java_class.class_
+        )
+
+    def _convert_warnings(
+        self, java_warnings
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Convert Java warnings to (warnings, errors) lists of dictionaries.
+
+        The whole list is serialized to JSON inside the JVM and parsed once in
+        Python, rather than reading each field of each warning through JPype.
+        """
+        return self._split_warnings(
+            self._write_json(self._warnings_writer, java_warnings)
+        )
+
+    @staticmethod
+    def _write_json(writer, value) -> Any:
+        """
+        Serialize a Java value with a Jackson writer and parse it in Python.
+
+        Jackson writes UTF-8 into a byte[] that orjson reads through the
+        buffer protocol, so the JSON is neither copied nor decoded from a
+        Java String on the way.
+        """
+        return orjson.loads(memoryview(writer.writeValueAsBytes(value)))
+
+    @staticmethod
+    def _split_warnings(
+        serialized_warnings: List[Dict[str, Any]],
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Split serialized Java warnings into warnings and errors."""
+        warnings = []
+        errors = []
+
+        for serialized in serialized_warnings:
+            warning_dict = {
+                "message": serialized["message"],
+                "severity": serialized.get("severity", "UNKNOWN"),
+                "type": serialized["type"],
+            }
+
+            # Categorize as warning or error based on severity; Jackson writes
+            # the WarningSeverity enum name, which is already upper case
+            if warning_dict["severity"] in _ERROR_SEVERITIES:
+                errors.append(warning_dict)
+            else:
+                warnings.append(warning_dict)
+
+        return warnings, errors
+
+    @staticmethod
+    def _validation_error(error: Exception) -> Dict[str, Any]:
+        """Build the error dictionary reported when validation itself fails."""
+        return {
+            "message": f"Validation error: {error}",
+            "severity": "CRITICAL",
+            "type": "VALIDATION_ERROR",
+        }
 
     def validate_cohort_file(
         self, file_path: str
@@ -185,32 +672,93 @@ class CohortValidator:
             containing validation results
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
+            with open(file_path, "rb") as f:
                 cohort_json = f.read()
-            return self.validate_cohort(cohort_json)
-        except FileNotFoundError:
-            return [], [
-                {
-                    "message": f"File not found: {file_path}",
-                    "severity": "CRITICAL",
-                    "type": "FILE_ERROR",
-                }
-            ]
         except Exception as e:
-            return [], [
-                {
-                    "message": f"File read error: {e}",
-                    "severity": "CRITICAL",
-                    "type": "FILE_ERROR",
-                }
-            ]
+            return [], [self._file_error(file_path, e)]
+        return self.validate_cohort(cohort_json)
+
+    def validate_cohort_files(
+        self, file_paths: Iterable[str], max_workers: Optional[int] = None
+    ) -> List[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        Validate cohort expressions from several JSON files in one batch.
+
+        The files that can be read are validated together with
+        ``validate_cohorts``; a file that cannot be read gets a FILE_ERROR
+        result instead.
+
+        Args:
+            file_paths: Paths to JSON files containing cohort expressions
+            max_workers: Number of checks to run at once, as for
+                ``validate_cohorts``
+
+        Returns:
+            List of (warnings, errors) tuples, in the same order as the input
+        """
+        results = []
+        indices = []
+        contents = []
+        for index, file_path in enumerate(file_paths):
+            try:
+                with open(file_path, "rb") as f:
+                    contents.append(f.read())
+            except Exception as e:
+                results.append(([], [self._file_error(file_path, e)]))
+            else:
+                results.append(None)
+                indices.append(index)
+
+        batch = self.validate_cohorts(contents, max_workers=max_workers)
+        for index, result in zip(indices, batch):
+            results[index] = result
+
+        return results
+
+    @staticmethod
+    def _file_error(file_path: str, error: Exception) -> Dict[str, Any]:
+        """Build the error dictionary reported when a file cannot be read."""
+        if isinstance(error, FileNotFoundError):
+            message = f"File not found: {file_path}"
+        else:
+            message = f"File read error: {error}"
+        return {"message": message, "severity": "CRITICAL", "type": "FILE_ERROR"}
 
     def shutdown(self):
         """Shutdown the JVM."""
+        with self._cache_lock:
+            self._cache.clear()
+        _CHECKER_CACHE.clear()
         if jpype.isJVMStarted():
             jpype.shutdownJVM()
         self._jvm_started = False
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Shut down the JVM on leaving a ``with`` block.
+
+        The JVM is shared by the whole process and cannot be restarted once
+        shut down, so use a single ``with`` block around all validation.
+        """
+        self.shutdown()
+
+    def __del__(self):
+        # Only warn, and only from the instance that started the JVM;
+        # shutting down the process-wide JVM here could break other
+        # validators that are still in use
+        try:
+            if self._jvm_started and jpype.isJVMStarted():
+                log.warning(
+                    "The CohortValidator that started the JVM was discarded "
+                    "while the JVM is running; the JVM cannot be restarted, so "
+                    "call shutdown() only once no validator is needed any more"
+                )
+        except Exception:
+            pass
+
 
 def main():
     """Example usage of the CohortValidator."""
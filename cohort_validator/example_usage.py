@@ -6,7 +6,7 @@ This script demonstrates how to use the CohortValidator to validate
 cohort expressions and handle the results.
 """
 
-import json
+import orjson
 
 from cohort_validator import CohortValidator
 
@@ -74,7 +74,7 @@ def main():
 
     try:
         # Convert to JSON string
-        cohort_json = json.dumps(sample_cohort, indent=2)
+        cohort_json = orjson.dumps(sample_cohort, option=orjson.OPT_INDENT_2)
 
         print("\nValidating cohort expression...")
         print(f"Cohort: {sample_cohort['ConceptSets'][0]['name']} condition")
@@ -110,8 +110,8 @@ def main():
 
         # Save cohort to file
         filename = "example_cohort.json"
-        with open(filename, "w") as f:
-            json.dump(sample_cohort, f, indent=2)
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(sample_cohort, option=orjson.OPT_INDENT_2))
 
         print(f"Saved cohort to {filename}")
 
@@ -0,0 +1,460 @@
+"""
+Test cases shared by the test modules.
+
+Each case is a (name, path, expected_errors) tuple, where path is relative to
+the repository root and expected_errors is None when the number of errors is
+not asserted. The simple suite's cases are SimpleCase tuples with the name and
+path first as well. The test scripts report each case's outcome as a
+CaseResult.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional
+
+CORRECT_CASES = (
+    # Basic correct cohorts
+    (
+        "Primary Criteria Correct",
+        "circe-be/src/test/resources/checkers/primaryCriteriaCheckValueCorrect.json",
+        0,
+    ),
+    (
+        "Additional Criteria Correct",
+        "circe-be/src/test/resources/checkers/additionalCriteriaCheckValueCorrect.json",
+        0,
+    ),
+    (
+        "Concept Set Criteria Correct",
+        "circe-be/src/test/resources/checkers/conceptSetCriteriaCheckCorrect.json",
+        0,
+    ),
+    (
+        "Unused Concept Set Correct",
+        "circe-be/src/test/resources/checkers/unusedConceptSetCorrect.json",
+        0,
+    ),
+    (
+        "Duplicates Concept Set Correct",
+        "circe-be/src/test/resources/checkers/duplicatesConceptSetCheckCorrect.json",
+        0,
+    ),
+    (
+        "Duplicates Criteria Correct",
+        "circe-be/src/test/resources/checkers/duplicatesCriteriaCheckCorrect.json",
+        0,
+    ),
+    (
+        "Domain Type Correct",
+        "circe-be/src/test/resources/checkers/domainTypeCheckCorrect.json",
+        0,
+    ),
+    (
+        "Drug Domain Correct",
+        "circe-be/src/test/resources/checkers/drugDomainCheckCorrect.json",
+        0,
+    ),
+    (
+        "Drug Era Correct",
+        "circe-be/src/test/resources/checkers/drugEraCheckCorrect.json",
+        0,
+    ),
+    (
+        "Death Time Window Correct",
+        "circe-be/src/test/resources/checkers/deathTimeWindowCheckCorrect.json",
+        0,
+    ),
+    (
+        "Time Pattern Correct",
+        "circe-be/src/test/resources/checkers/timePatternCheckCorrect.json",
+        0,
+    ),
+    (
+        "Events Progression Correct",
+        "circe-be/src/test/resources/checkers/eventsProgressionCheckCorrect.json",
+        0,
+    ),
+    (
+        "Contradictions Criteria Correct",
+        "circe-be/src/test/resources/checkers/contradictionsCriteriaCheckCorrect.json",
+        0,
+    ),
+    (
+        "Inclusion Rules Correct",
+        "circe-be/src/test/resources/checkers/inclusionRulesCheckValueCorrect.json",
+        0,
+    ),
+    (
+        "Censoring Event Correct",
+        "circe-be/src/test/resources/checkers/censoringEventCheckValueCorrect.json",
+        0,
+    ),
+    (
+        "Empty Demographic Correct",
+        "circe-be/src/test/resources/checkers/emptyDemographicCheckCorrect.json",
+        0,
+    ),
+    # Complex correct cohorts
+    (
+        "Child Group Expression",
+        "circe-be/src/test/resources/checkers/childGroupExpression.json",
+        0,
+    ),
+    (
+        "All Criteria Expression",
+        "circe-be/src/test/resources/cohortgeneration/allCriteria/allCriteriaExpression.json",
+        0,
+    ),
+    (
+        "Censor Window Expression",
+        "circe-be/src/test/resources/cohortgeneration/censorWindow/censorWindowExpression.json",
+        0,
+    ),
+    (
+        "Era Dupes Expression",
+        "circe-be/src/test/resources/cohortgeneration/eraDupes/eraDupesExpression.json",
+        0,
+    ),
+)
+
+INCORRECT_CASES = (
+    # These should have errors
+    (
+        "Primary Criteria Incorrect",
+        "circe-be/src/test/resources/checkers/primaryCriteriaCheckValueIncorrect.json",
+        None,
+    ),
+    (
+        "Additional Criteria Incorrect",
+        "circe-be/src/test/resources/checkers/additionalCriteriaCheckValueIncorrect.json",
+        None,
+    ),
+    (
+        "Concept Set Criteria Incorrect",
+        "circe-be/src/test/resources/checkers/conceptSetCriteriaCheckIncorrect.json",
+        None,
+    ),
+    (
+        "Unused Concept Set",
+        "circe-be/src/test/resources/checkers/unusedConceptSet.json",
+        None,
+    ),
+    (
+        "Duplicates Concept Set Incorrect",
+        "circe-be/src/test/resources/checkers/duplicatesConceptSetCheckIncorrect.json",
+        None,
+    ),
+    (
+        "Duplicates Criteria Incorrect",
+        "circe-be/src/test/resources/checkers/duplicatesCriteriaCheckIncorrect.json",
+        None,
+    ),
+    (
+        "Domain Type Incorrect",
+        "circe-be/src/test/resources/checkers/domainTypeCheckIncorrect.json",
+        None,
+    ),
+    (
+        "Drug Domain Incorrect",
+        "circe-be/src/test/resources/checkers/drugDomainCheckIncorrect.json",
+        None,
+    ),
+    (
+        "Drug Era Incorrect",
+        "circe-be/src/test/resources/checkers/drugEraCheckIncorrect.json",
+        None,
+    ),
+    (
+        "Death Time Window Incorrect",
+        "circe-be/src/test/resources/checkers/deathTimeWindowCheckIncorrect.json",
+        None,
+    ),
+    (
+        "Time Pattern Incorrect",
+        "circe-be/src/test/resources/checkers/timePatternCheckIncorrect.json",
+        None,
+    ),
+    (
+        "Events Progression Incorrect",
+        "circe-be/src/test/resources/checkers/eventsProgressionCheckIncorrect.json",
+        None,
+    ),
+    (
+        "Contradictions Criteria Incorrect",
+        "circe-be/src/test/resources/checkers/contradictionsCriteriaCheckIncorrect.json",
+        None,
+    ),
+    (
+        "Inclusion Rules Incorrect",
+        "circe-be/src/test/resources/checkers/inclusionRulesCheckValueIncorrect.json",
+        None,
+    ),
+    (
+        "Censoring Event Incorrect",
+        "circe-be/src/test/resources/checkers/censoringEventCheckValueIncorrect.json",
+        None,
+    ),
+    (
+        "Empty Demographic Incorrect",
+        "circe-be/src/test/resources/checkers/emptyDemographicCheckIncorrect.json",
+        None,
+    ),
+    # Special cases
+    (
+        "Concept Set With Duplicate Items",
+        "circe-be/src/test/resources/checkers/conceptSetWithDuplicateItems.json",
+        None,
+    ),
+    (
+        "Empty Censoring Criteria List",
+        "circe-be/src/test/resources/checkers/emptyCensoringCriteriaList.json",
+        None,
+    ),
+    (
+        "Empty Correlated Criteria",
+        "circe-be/src/test/resources/checkers/emptyCorrelatedCriteria.json",
+        None,
+    ),
+    (
+        "Empty Inclusion Rules",
+        "circe-be/src/test/resources/checkers/emptyInclusionRules.json",
+        None,
+    ),
+    (
+        "Empty Primary Criteria List",
+        "circe-be/src/test/resources/checkers/emptyPrimaryCriteriaList.json",
+        None,
+    ),
+    (
+        "No Exit Criteria Check",
+        "circe-be/src/test/resources/checkers/noExitCriteriaCheck.json",
+        None,
+    ),
+)
+
+COMPLEX_CASES = (
+    (
+        "Condition Occurrence Status Test",
+        "circe-be/src/test/resources/cohortgeneration/conditionOccurrence/conditionStatusTest_VERIFY.json",
+        0,
+    ),
+    (
+        "Counts Expression",
+        "circe-be/src/test/resources/cohortgeneration/correlatedCriteria/countsExpression.json",
+        0,
+    ),
+    (
+        "Group Expression",
+        "circe-be/src/test/resources/cohortgeneration/correlatedCriteria/groupExpression.json",
+        0,
+    ),
+    (
+        "Visit Expression",
+        "circe-be/src/test/resources/cohortgeneration/correlatedCriteria/visitExpression.json",
+        0,
+    ),
+    (
+        "First Occurrence Expression",
+        "circe-be/src/test/resources/cohortgeneration/firstOccurrence/firstOccurrenceExpression.json",
+        0,
+    ),
+    (
+        "Inclusion Rules Expression",
+        "circe-be/src/test/resources/cohortgeneration/inclusionRules/inclusionRulesExpression.json",
+        0,
+    ),
+    (
+        "Limits Expression",
+        "circe-be/src/test/resources/cohortgeneration/limits/limitsExpression.json",
+        0,
+    ),
+    (
+        "Mixed Concept Sets Expression",
+        "circe-be/src/test/resources/cohortgeneration/mixedConceptsets/mixedConceptsetsExpression.json",
+        0,
+    ),
+    (
+        "Dupilumab Expression",
+        "circe-be/src/test/resources/conceptset/dupilumabExpression.json",
+        0,
+    ),
+    (
+        "Dupixent Expression",
+        "circe-be/src/test/resources/conceptset/dupixentExpression.json",
+        0,
+    ),
+    (
+        "Payer Plan Cohort Expression",
+        "circe-be/src/test/resources/versioning/payerPlanCohortExpression.json",
+        0,
+    ),
+)
+
+EDGE_CASES = (
+    (
+        "No Exit Criteria Check Earliest Event",
+        "circe-be/src/test/resources/checkers/noExitCriteriaCheckEarliestEvent.json",
+        None,
+    ),
+    (
+        "Build Options Test",
+        "circe-be/src/test/resources/cohortdefinition/buildOptionsTest.json",
+        0,
+    ),
+    ("Vocabulary Dataset", "circe-be/src/test/resources/datasets/vocabulary.json", 0),
+)
+
+# Cases by the category they are reported under
+CASES_BY_CATEGORY = {
+    "correct": CORRECT_CASES,
+    "incorrect": INCORRECT_CASES,
+    "complex": COMPLEX_CASES,
+    "edge": EDGE_CASES,
+}
+
+ALL_CASES = CORRECT_CASES + INCORRECT_CASES + COMPLEX_CASES + EDGE_CASES
+
+CASES_BY_NAME = {case[0]: case for case in ALL_CASES}
+
+# Representative sample validated by test_final.py
+FINAL_CASES = tuple(
+    CASES_BY_NAME[name]
+    for name in (
+        # Correct cohorts
+        "Primary Criteria Correct",
+        "Concept Set Criteria Correct",
+        "Unused Concept Set Correct",
+        "Domain Type Correct",
+        "Drug Domain Correct",
+        "Time Pattern Correct",
+        "Events Progression Correct",
+        # Complex cohorts
+        "All Criteria Expression",
+        "Censor Window Expression",
+        "Counts Expression",
+        "Group Expression",
+        "Visit Expression",
+        "Mixed Concept Sets Expression",
+        # Incorrect cohorts (should have validation issues)
+        "Primary Criteria Incorrect",
+        "Additional Criteria Incorrect",
+        "Unused Concept Set",
+        "Duplicates Concept Set Incorrect",
+        "Duplicates Criteria Incorrect",
+        "Domain Type Incorrect",
+        "Drug Domain Incorrect",
+        "Time Pattern Incorrect",
+        "Events Progression Incorrect",
+        "Contradictions Criteria Incorrect",
+        "Inclusion Rules Incorrect",
+    )
+)
+
+
+class SimpleCase(NamedTuple):
+    """A case of test_simple_comprehensive.py and the result it expects."""
+
+    name: str
+    path: str
+    # Whether the file should produce errors; if not, it must produce none
+    expect_errors: bool
+    # Minimum number of warnings expected when no errors are expected
+    min_warnings: int = 0
+
+
+def _simple_case(name: str, expect_errors: bool, min_warnings: int = 0) -> SimpleCase:
+    return SimpleCase(name, CASES_BY_NAME[name][1], expect_errors, min_warnings)
+
+
+# Cases checked by test_simple_comprehensive.py
+SIMPLE_CASES = (
+    # Correct cohorts (should have minimal errors, some warnings OK)
+    _simple_case("Primary Criteria Correct", False),
+    _simple_case("Additional Criteria Correct", False),
+    _simple_case("Concept Set Criteria Correct", False),
+    _simple_case("Unused Concept Set Correct", False),
+    _simple_case("Duplicates Concept Set Correct", False),
+    _simple_case("Duplicates Criteria Correct", False),
+    _simple_case("Domain Type Correct", False),
+    _simple_case("Drug Domain Correct", False),
+    _simple_case("Drug Era Correct", False),
+    _simple_case("Death Time Window Correct", False),
+    _simple_case("Time Pattern Correct", False),
+    _simple_case("Events Progression Correct", False),
+    _simple_case("Contradictions Criteria Correct", False),
+    _simple_case("Inclusion Rules Correct", False),
+    _simple_case("Censoring Event Correct", False),
+    _simple_case("Empty Demographic Correct", False),
+    _simple_case("Child Group Expression", False),
+    _simple_case("All Criteria Expression", False),
+    _simple_case("Censor Window Expression", False),
+    _simple_case("Era Dupes Expression", False),
+    _simple_case("Counts Expression", False),
+    _simple_case("Group Expression", False),
+    _simple_case("Visit Expression", False),
+    _simple_case("First Occurrence Expression", False),
+    _simple_case("Inclusion Rules Expression", False),
+    _simple_case("Limits Expression", False),
+    _simple_case("Mixed Concept Sets Expression", False),
+    _simple_case("Dupilumab Expression", False),
+    _simple_case("Dupixent Expression", False),
+    _simple_case("Payer Plan Cohort Expression", False),
+    # Incorrect cohorts (should have errors)
+    _simple_case("Primary Criteria Incorrect", True),
+    _simple_case("Additional Criteria Incorrect", True),
+    _simple_case("Concept Set Criteria Incorrect", True),
+    _simple_case("Unused Concept Set", False, min_warnings=10),
+    _simple_case("Duplicates Concept Set Incorrect", True),
+    _simple_case("Duplicates Criteria Incorrect", True),
+    _simple_case("Domain Type Incorrect", True),
+    _simple_case("Drug Domain Incorrect", True),
+    _simple_case("Drug Era Incorrect", True),
+    _simple_case("Death Time Window Incorrect", True),
+    _simple_case("Time Pattern Incorrect", True),
+    _simple_case("Events Progression Incorrect", True),
+    _simple_case("Contradictions Criteria Incorrect", True),
+    _simple_case("Inclusion Rules Incorrect", True),
+    _simple_case("Censoring Event Incorrect", True),
+    _simple_case("Empty Demographic Incorrect", True),
+)
+
+
+class CaseResult:
+    """
+    The outcome of one case run by a test script.
+
+    A plain class with __slots__ rather than a dict: the scripts create one
+    per case and read its fields as attributes. (dataclass(slots=True) needs
+    Python 3.10.)
+    """
+
+    __slots__ = ("name", "file", "passed", "warnings", "errors", "error_message")
+
+    def __init__(self, name: str, file: str):
+        self.name = name
+        self.file = file
+        self.passed = False
+        self.warnings: List[Dict[str, Any]] = []
+        self.errors: List[Dict[str, Any]] = []
+        self.error_message: Optional[str] = None
+
+
+class SimpleResult(CaseResult):
+    """A CaseResult of test_simple_comprehensive.py."""
+
+    __slots__ = ("category",)
+
+    def __init__(self, name: str, file: str, category: str):
+        super().__init__(name, file)
+        # "correct" or "incorrect"
+        self.category = category
+
+
+class ScenarioResult(CaseResult):
+    """A CaseResult of test_validation_scenarios.py."""
+
+    __slots__ = ("expected_types", "validation_types_found")
+
+    def __init__(self, name: str, file: str, expected_types: List[str]):
+        super().__init__(name, file)
+        self.expected_types = expected_types
+        # A ValidationType bit mask of the types the messages reported
+        self.validation_types_found = 0
@@ -0,0 +1,46 @@
+"""
+A stand-in for CohortValidator, so the --serve/--client tests need no JVM.
+
+Run as a script, it serves the fake validator on the socket given as its only
+argument, like ``cohort-validate --serve SOCKET``.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+import orjson
+
+
+class FakeValidator:
+    """Answers every cohort with one warning naming its Title."""
+
+    checker = None
+
+    def __init__(self):
+        self.shut_down = False
+
+    def validate_cohort(
+        self, cohort_json: Union[dict, str, bytes]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        if not isinstance(cohort_json, dict):
+            cohort_json = orjson.loads(cohort_json)
+        warning = {
+            "message": f"Checked {cohort_json.get('Title')}",
+            "severity": "INFO",
+            "type": "FAKE",
+        }
+        return [warning], []
+
+    def validate_cohorts(
+        self, cohorts: Iterable[Union[dict, str, bytes]]
+    ) -> List[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        return [self.validate_cohort(cohort) for cohort in cohorts]
+
+    def shutdown(self):
+        self.shut_down = True
+
+
+if __name__ == "__main__":
+    from cohort_validator.cli import serve
+
+    serve(sys.argv[1], FakeValidator())
@@ -0,0 +1,77 @@
+"""
+Helpers shared by the test modules, the test scripts and the fixtures.
+
+Kept out of conftest.py so that modules import them as a plain module, which
+works whichever import mode pytest uses.
+"""
+
+import atexit
+import functools
+import os
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, List, Tuple
+
+from _cases import ALL_CASES
+
+if TYPE_CHECKING:
+    from cohort_validator import CohortValidator
+
+# Validation results by test file path, as returned by validate_files()
+ValidationResults = Dict[str, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]
+
+
+def _existing_files(roots: Iterable[str]) -> FrozenSet[str]:
+    """Return the paths of the JSON files directly inside the root directories."""
+    present = set()
+    for root in roots:
+        try:
+            with os.scandir(root) as entries:
+                present.update(
+                    f"{root}/{entry.name}"
+                    for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                )
+        except OSError:
+            continue
+    return frozenset(present)
+
+
+# The JSON files in the directories holding the shared test cases, which
+# also hold every other test file. One scandir per directory replaces a stat
+# per test case and skips the rest of the CIRCE resources tree
+PRESENT_FILES = _existing_files({os.path.dirname(path) for _, path, _ in ALL_CASES})
+
+
+def validate_files(
+    validator: "CohortValidator", cases: Iterable[Tuple[Any, ...]]
+) -> ValidationResults:
+    """
+    Validate the files of all present test cases with a single batch call.
+
+    Each case is a tuple with the test name first and the file path second.
+    The results are also left in the validator's cache, so validating the
+    same files again does not reach the JVM.
+    """
+    paths = sorted({case[1] for case in cases if case[1] in PRESENT_FILES})
+    return dict(zip(paths, validator.validate_cohort_files(paths)))
+
+
+@functools.lru_cache(maxsize=None)
+def get_validator() -> "CohortValidator":
+    """
+    Return the validator shared by the test scripts' main() functions.
+
+    A JVM cannot be restarted within a process, so scripts run one after the
+    other in the same interpreter share one validator, shut down at exit.
+    """
+    from cohort_validator import CohortValidator
+
+    validator = CohortValidator()
+    atexit.register(validator.shutdown)
+    return validator
+
+
+@functools.lru_cache(maxsize=None)
+def read_cohort_json(path: str) -> bytes:
+    """Read a cohort JSON file once; later calls return the cached bytes."""
+    with open(path, "rb") as f:
+        return f.read()
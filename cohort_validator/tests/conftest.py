@@ -0,0 +1,200 @@
+"""Shared pytest fixtures and hooks for the cohort validator test suite."""
+
+import contextlib
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+
+import orjson
+import pytest
+from _cases import ALL_CASES
+from _shared import ValidationResults, validate_files
+
+if TYPE_CHECKING:
+    # Imported by the fixtures instead, so that collecting or deselecting
+    # tests does not load JPype
+    from cohort_validator import CohortValidator
+
+# Test outcomes by case category, for --summary-json
+_CATEGORY_OUTCOMES: Dict[str, Counter] = defaultdict(Counter)
+
+# Minimal cohort expression used to warm up the JVM; titles make each copy
+# distinct so none is answered from the validator's result cache
+WARMUP_COHORT = {
+    "ConceptSets": [{"id": 0, "name": "Warm-up", "expression": {"items": []}}],
+    "PrimaryCriteria": {
+        "CriteriaList": [{"ConditionOccurrence": {"CodesetId": 0}}],
+        "ObservationWindow": {"PriorDays": 0, "PostDays": 0},
+    },
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--summary-json",
+        metavar="PATH",
+        help="write the outcomes of the test cases by category to PATH as JSON",
+    )
+
+
+def pytest_collection_modifyitems(items):
+    # Tag test cases with their category; user properties are carried by the
+    # test reports, across xdist workers and into --junitxml output
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and "category" in callspec.params:
+            item.user_properties.append(("category", callspec.params["category"]))
+
+
+def pytest_runtest_logreport(report):
+    # The call report decides the outcome, unless setup failed or skipped
+    if report.when != "call" and report.passed:
+        return
+    for name, value in report.user_properties:
+        if name == "category":
+            _CATEGORY_OUTCOMES[value][report.outcome] += 1
+
+
+def pytest_sessionfinish(session, exitstatus):
+    path = session.config.getoption("summary_json")
+    # Under xdist only the controller sees the reports of every worker
+    if path and not hasattr(session.config, "workerinput"):
+        summary = {
+            "exitstatus": int(exitstatus),
+            "categories": {
+                category: dict(outcomes)
+                for category, outcomes in sorted(_CATEGORY_OUTCOMES.items())
+            },
+        }
+        Path(path).write_bytes(orjson.dumps(summary))
+
+
+@pytest.fixture(scope="session")
+def validator(tmp_path_factory):
+    """
+    Shared validator instance for all tests, so the JVM starts only once.
+
+    Under pytest-xdist every worker would start its own JVM; instead the
+    first worker starts a ``cohort-validate --serve`` process and all workers
+    validate through it.
+    """
+    from cohort_validator import FAST_START_JVM_ARGS, CohortValidator
+
+    if "PYTEST_XDIST_WORKER" not in os.environ:
+        validator = CohortValidator(jvm_args=FAST_START_JVM_ARGS)
+        _warm_up(validator)
+        yield validator
+        validator.shutdown()
+        return
+
+    # The parent of the per-worker base directory is shared by all workers
+    with _shared_server(tmp_path_factory.getbasetemp().parent) as socket_path:
+        yield CohortValidator(socket_path=socket_path)
+
+
+@pytest.fixture(scope="session")
+def validation_results(validator: "CohortValidator") -> ValidationResults:
+    """
+    Results for every shared test case, validated once per session in one
+    batch and shared by all test modules.
+    """
+    return validate_files(validator, ALL_CASES)
+
+
+@contextlib.contextmanager
+def _shared_server(root: Path):
+    """
+    Run one validation server for all xdist workers that use it.
+
+    Workers register in a counter file guarded by a file lock; the first one
+    starts the server and the last one to leave stops it and waits for it to
+    exit.
+    """
+    from filelock import FileLock
+
+    from cohort_validator import CohortValidator
+
+    lock = FileLock(str(root / "validator.lock"))
+    users_file = root / "validator.users"
+    pid_file = root / "validator.pid"
+    socket_path = str(root / "validator.sock")
+    server = None
+
+    with lock:
+        users = int(users_file.read_text()) if users_file.exists() else 0
+        if users == 0:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            server = subprocess.Popen(
+                [sys.executable, "-m", "cohort_validator.cli", "--serve", socket_path]
+            )
+            pid_file.write_text(str(server.pid))
+            _wait_for_server(socket_path, server)
+            _warm_up(CohortValidator(socket_path=socket_path))
+        users_file.write_text(str(users + 1))
+
+    try:
+        yield socket_path
+    finally:
+        with lock:
+            users = int(users_file.read_text()) - 1
+            users_file.write_text(str(users))
+            if users == 0:
+                _stop_server(server, int(pid_file.read_text()), socket_path)
+
+
+def _stop_server(
+    server: Optional[subprocess.Popen], pid: int, socket_path: str, timeout=60.0
+):
+    """
+    Terminate the shared validation server and wait until it has stopped.
+
+    On SIGTERM the server removes its socket and shuts down the JVM. Only the
+    worker that started the server can wait for the process itself; any other
+    waits for the socket to be removed.
+    """
+    if server is not None:
+        server.terminate()
+        server.wait(timeout)
+        return
+
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    deadline = time.monotonic() + timeout
+    while os.path.exists(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.1)
+
+
+def _warm_up(validator: "CohortValidator", rounds: int = 10):
+    """
+    Validate a few trivial cohorts so that class loading and the first JIT
+    compilations happen before the first test rather than during it.
+    """
+    validator.validate_cohorts(
+        [dict(WARMUP_COHORT, Title=f"Warm-up {i}") for i in range(rounds)]
+    )
+
+
+def _wait_for_server(socket_path: str, server: subprocess.Popen, timeout=60.0):
+    """Wait until a freshly started server accepts connections."""
+    deadline = time.monotonic() + timeout
+    while True:
+        if server.poll() is not None:
+            raise RuntimeError(f"Validation server exited with {server.returncode}")
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(socket_path)
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                server.kill()
+                raise RuntimeError("Validation server did not start in time")
+            time.sleep(0.1)
@@ -0,0 +1,193 @@
+"""
+Tests for the --serve and --client modes of the command-line interface.
+
+The server runs a FakeValidator, so these tests start no JVM.
+"""
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import orjson
+import pytest
+from _fake_server import FakeValidator
+
+_TESTS_DIR = Path(__file__).resolve().parent
+_ENV = dict(os.environ, PYTHONPATH=str(_TESTS_DIR.parents[1]))
+
+COHORT = {"ConceptSets": [], "PrimaryCriteria": {}, "Title": "Sample"}
+
+
+def _start_server(socket_path: Path) -> subprocess.Popen:
+    """Start a fake validation server and wait until it accepts connections."""
+    server = subprocess.Popen(
+        [sys.executable, str(_TESTS_DIR / "_fake_server.py"), str(socket_path)],
+        env=_ENV,
+    )
+    deadline = time.monotonic() + 30
+    while True:
+        assert server.poll() is None, "fake server exited"
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(str(socket_path))
+            return server
+        except OSError:
+            assert time.monotonic() < deadline, "fake server did not start"
+            time.sleep(0.05)
+
+
+def _stop_server(server: subprocess.Popen, signum=signal.SIGINT) -> int:
+    server.send_signal(signum)
+    return server.wait(timeout=30)
+
+
+@pytest.fixture
+def fake_server(tmp_path: Path):
+    """Path of the socket of a running fake validation server."""
+    socket_path = tmp_path / "validator.sock"
+    server = _start_server(socket_path)
+    try:
+        yield socket_path
+    finally:
+        if server.poll() is None:
+            _stop_server(server)
+
+
+def test_client_validates_through_server(fake_server: Path):
+    """Test that a socket validator gets its results from the server."""
+    from cohort_validator import CohortValidator
+
+    warnings, errors = CohortValidator(socket_path=str(fake_server)).validate_cohort(
+        COHORT
+    )
+
+    assert [w["message"] for w in warnings] == ["Checked Sample"]
+    assert errors == []
+
+
+def test_client_batch_uses_one_request(fake_server: Path, monkeypatch):
+    """Test that a socket validator sends a batch to the server at once."""
+    from cohort_validator import CohortValidator
+
+    validator = CohortValidator(socket_path=str(fake_server))
+
+    def request_validation(payload):
+        raise AssertionError("cohort sent on its own")
+
+    monkeypatch.setattr(validator, "_request_validation", request_validation)
+
+    results = validator.validate_cohorts(
+        [dict(COHORT, Title="First"), dict(COHORT, Title="Second")]
+    )
+
+    assert [warnings[0]["message"] for warnings, _ in results] == [
+        "Checked First",
+        "Checked Second",
+    ]
+
+
+def test_server_handles_connections_in_parallel(fake_server: Path):
+    """Test that an unfinished request does not hold up other clients."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as idle:
+        idle.connect(str(fake_server))
+        idle.sendall(b'{"Title": ')
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(30)
+            sock.connect(str(fake_server))
+            sock.sendall(orjson.dumps(COHORT) + b"\n")
+            with sock.makefile("rb") as f:
+                response = orjson.loads(f.readline())
+
+    assert [w["message"] for w in response["warnings"]] == ["Checked Sample"]
+
+
+def test_cli_client(fake_server: Path, tmp_path: Path):
+    """Test that cohort-validate --client prints the server's results."""
+    cohort_file = tmp_path / "cohort.json"
+    cohort_file.write_bytes(orjson.dumps(COHORT))
+
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "cohort_validator.cli",
+            "--client",
+            str(fake_server),
+            str(cohort_file),
+        ],
+        env=_ENV,
+        capture_output=True,
+        check=True,
+    )
+
+    output = orjson.loads(completed.stdout)
+    assert output["summary"] == {
+        "total_warnings": 1,
+        "total_errors": 0,
+        "is_valid": True,
+    }
+
+
+def test_serve_removes_its_socket(tmp_path: Path):
+    """Test that an interrupted server exits cleanly and removes its socket."""
+    socket_path = tmp_path / "validator.sock"
+    server = _start_server(socket_path)
+
+    assert _stop_server(server) == 0
+    assert not socket_path.exists()
+
+
+def test_serve_stops_on_sigterm(tmp_path: Path):
+    """Test that a terminated server exits cleanly and removes its socket."""
+    socket_path = tmp_path / "validator.sock"
+    server = _start_server(socket_path)
+
+    assert _stop_server(server, signal.SIGTERM) == 0
+    assert not socket_path.exists()
+
+
+def test_serve_replaces_stale_socket(tmp_path: Path):
+    """Test that a socket nobody listens on is replaced."""
+    socket_path = tmp_path / "validator.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(str(socket_path))
+    assert socket_path.exists()
+
+    server = _start_server(socket_path)
+
+    assert _stop_server(server) == 0
+
+
+def test_serve_refuses_running_server(fake_server: Path):
+    """Test that a second server does not take over a live socket."""
+    from cohort_validator import CohortValidator
+    from cohort_validator.cli import serve
+
+    validator = FakeValidator()
+
+    with pytest.raises(RuntimeError, match="already running"):
+        serve(str(fake_server), validator)
+
+    # The first server still answers
+    warnings, _ = CohortValidator(socket_path=str(fake_server)).validate_cohort(COHORT)
+    assert len(warnings) == 1
+
+
+def test_serve_keeps_other_files(tmp_path: Path):
+    """Test that a server never deletes a file that is not its socket."""
+    from cohort_validator.cli import serve
+
+    data_file = tmp_path / "data.txt"
+    data_file.write_text("keep me")
+    validator = FakeValidator()
+
+    with pytest.raises(OSError):
+        serve(str(data_file), validator)
+
+    assert data_file.read_text() == "keep me"
+    assert validator.shut_down
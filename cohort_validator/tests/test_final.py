@@ -6,24 +6,27 @@ This test demonstrates that the Python-Java integration is working correctly
 by validating various cohort expressions and showing the results.
 """
 
-import json
-import os
-from typing import Any, Dict, List
-
-import pytest
-
-from cohort_validator import CohortValidator
-
-
-@pytest.fixture(scope="session")
-def validator():
-    """Shared validator instance for all tests."""
-    validator = CohortValidator()
-    yield validator
-    # Don't shutdown the JVM - let it be cleaned up by pytest
-
-
-def test_cohort_validation(validator):
+import itertools
+from collections import Counter
+from typing import Any, Dict
+
+from _cases import FINAL_CASES
+from _shared import ValidationResults
+
+# Summary order of the categories reported by ``categorize_message``
+CATEGORIES = (
+    "unused_concepts",
+    "empty_values",
+    "duplicates",
+    "contradictions",
+    "time_windows",
+    "domain_types",
+    "missing_criteria",
+    "other",
+)
+
+
+def test_cohort_validation(validation_results: ValidationResults):
     """Test comprehensive cohort validation with multiple test files."""
     print("CIRCE Cohort Validator - Final Comprehensive Test")
     print("=" * 60)
@@ -31,109 +34,9 @@ def test_cohort_validation(validator):
 
     try:
         # Test a representative sample of files
-        test_files = [
-            # Correct cohorts
-            (
-                "Primary Criteria Correct",
-                "circe-be/src/test/resources/checkers/primaryCriteriaCheckValueCorrect.json",
-            ),
-            (
-                "Concept Set Criteria Correct",
-                "circe-be/src/test/resources/checkers/conceptSetCriteriaCheckCorrect.json",
-            ),
-            (
-                "Unused Concept Set Correct",
-                "circe-be/src/test/resources/checkers/unusedConceptSetCorrect.json",
-            ),
-            (
-                "Domain Type Correct",
-                "circe-be/src/test/resources/checkers/domainTypeCheckCorrect.json",
-            ),
-            (
-                "Drug Domain Correct",
-                "circe-be/src/test/resources/checkers/drugDomainCheckCorrect.json",
-            ),
-            (
-                "Time Pattern Correct",
-                "circe-be/src/test/resources/checkers/timePatternCheckCorrect.json",
-            ),
-            (
-                "Events Progression Correct",
-                "circe-be/src/test/resources/checkers/eventsProgressionCheckCorrect.json",
-            ),
-            # Complex cohorts
-            (
-                "All Criteria Expression",
-                "circe-be/src/test/resources/cohortgeneration/allCriteria/allCriteriaExpression.json",
-            ),
-            (
-                "Censor Window Expression",
-                "circe-be/src/test/resources/cohortgeneration/censorWindow/censorWindowExpression.json",
-            ),
-            (
-                "Counts Expression",
-                "circe-be/src/test/resources/cohortgeneration/correlatedCriteria/countsExpression.json",
-            ),
-            (
-                "Group Expression",
-                "circe-be/src/test/resources/cohortgeneration/correlatedCriteria/groupExpression.json",
-            ),
-            (
-                "Visit Expression",
-                "circe-be/src/test/resources/cohortgeneration/correlatedCriteria/visitExpression.json",
-            ),
-            (
-                "Mixed Concept Sets Expression",
-                "circe-be/src/test/resources/cohortgeneration/mixedConceptsets/mixedConceptsetsExpression.json",
-            ),
-            # Incorrect cohorts (should have validation issues)
-            (
-                "Primary Criteria Incorrect",
-                "circe-be/src/test/resources/checkers/primaryCriteriaCheckValueIncorrect.json",
-            ),
-            (
-                "Additional Criteria Incorrect",
-                "circe-be/src/test/resources/checkers/additionalCriteriaCheckValueIncorrect.json",
-            ),
-            (
-                "Unused Concept Set",
-                "circe-be/src/test/resources/checkers/unusedConceptSet.json",
-            ),
-            (
-                "Duplicates Concept Set Incorrect",
-                "circe-be/src/test/resources/checkers/duplicatesConceptSetCheckIncorrect.json",
-            ),
-            (
-                "Duplicates Criteria Incorrect",
-                "circe-be/src/test/resources/checkers/duplicatesCriteriaCheckIncorrect.json",
-            ),
-            (
-                "Domain Type Incorrect",
-                "circe-be/src/test/resources/checkers/domainTypeCheckIncorrect.json",
-            ),
-            (
-                "Drug Domain Incorrect",
-                "circe-be/src/test/resources/checkers/drugDomainCheckIncorrect.json",
-            ),
-            (
-                "Time Pattern Incorrect",
-                "circe-be/src/test/resources/checkers/timePatternCheckIncorrect.json",
-            ),
-            (
-                "Events Progression Incorrect",
-                "circe-be/src/test/resources/checkers/eventsProgressionCheckIncorrect.json",
-            ),
-            (
-                "Contradictions Criteria Incorrect",
-                "circe-be/src/test/resources/checkers/contradictionsCriteriaCheckIncorrect.json",
-            ),
-            (
-                "Inclusion Rules Incorrect",
-                "circe-be/src/test/resources/checkers/inclusionRulesCheckValueIncorrect.json",
-            ),
-        ]
-
-        results = []
+        test_files = [(name, path) for name, path, _ in FINAL_CASES]
+
+        categories: Counter = Counter()
         successful_tests = 0
         total_warnings = 0
         total_errors = 0
@@ -143,13 +46,14 @@ def test_cohort_validation(validator):
         for i, (name, file_path) in enumerate(test_files, 1):
             print(f"[{i:2d}/{len(test_files)}] {name}")
 
-            result = _test_single_cohort_file(validator, name, file_path)
-            results.append(result)
+            result = _test_single_cohort_file(
+                validation_results, name, file_path, categories
+            )
 
             if result["success"]:
                 successful_tests += 1
-                warnings_count = len(result["warnings"])
-                errors_count = len(result["errors"])
+                warnings_count = result["warnings_count"]
+                errors_count = result["errors_count"]
                 total_warnings += warnings_count
                 total_errors += errors_count
 
@@ -160,10 +64,7 @@ def test_cohort_validation(validator):
                 # Show a sample of validation messages for interesting cases
                 if errors_count > 0 or warnings_count > 10:
                     print(f"         Sample messages:")
-                    sample_messages = (result["warnings"][:2] + result["errors"][:2])[
-                        :3
-                    ]
-                    for msg in sample_messages:
+                    for msg in result["sample_messages"]:
                         severity = msg.get("severity", "UNKNOWN")
                         message = msg.get("message", "")[:80] + (
                             "..." if len(msg.get("message", "")) > 80 else ""
@@ -174,9 +75,6 @@ def test_cohort_validation(validator):
 
             print()
 
-        # Categorize validation results
-        categories = categorize_validation_results(results)
-
         # Print comprehensive summary
         print("=" * 60)
         print("COMPREHENSIVE TEST SUMMARY")
@@ -192,7 +90,8 @@ def test_cohort_validation(validator):
         print(f"Total Errors Found: {total_errors}")
 
         print(f"\nValidation Categories Detected:")
-        for category, count in categories.items():
+        for category in CATEGORIES:
+            count = categories[category]
             if count > 0:
                 print(f"  {category.replace('_', ' ').title()}: {count} issues")
 
@@ -222,26 +121,37 @@ def test_cohort_validation(validator):
 
 
 def _test_single_cohort_file(
-    validator: CohortValidator, test_name: str, test_file: str
+    results: ValidationResults, test_name: str, test_file: str, categories: Counter
 ) -> Dict[str, Any]:
-    """Test a single cohort file and return detailed results."""
+    """
+    Test a single cohort file, tallying its messages into ``categories``.
+
+    Only the message counts and a short sample are kept, so the summary does
+    not hold on to every validation message until the run finishes.
+    """
     result = {
         "name": test_name,
         "file": test_file,
         "success": False,
-        "warnings": [],
-        "errors": [],
+        "warnings_count": 0,
+        "errors_count": 0,
+        "sample_messages": [],
         "error_message": None,
     }
 
     try:
-        if not os.path.exists(test_file):
+        if test_file not in results:
             result["error_message"] = f"Test file not found: {test_file}"
             return result
 
-        warnings, errors = validator.validate_cohort_file(test_file)
-        result["warnings"] = warnings
-        result["errors"] = errors
+        warnings, errors = results[test_file]
+        categories.update(
+            categorize_message(entry["message"])
+            for entry in itertools.chain(warnings, errors)
+        )
+        result["warnings_count"] = len(warnings)
+        result["errors_count"] = len(errors)
+        result["sample_messages"] = (warnings[:2] + errors[:2])[:3]
         result["success"] = True
 
     except Exception as e:
@@ -250,53 +160,28 @@ def _test_single_cohort_file(
     return result
 
 
-def categorize_validation_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Categorize validation results by type."""
-    categories = {
-        "unused_concepts": 0,
-        "empty_values": 0,
-        "duplicates": 0,
-        "contradictions": 0,
-        "time_windows": 0,
-        "domain_types": 0,
-        "missing_criteria": 0,
-        "other": 0,
-    }
-
-    for result in results:
-        if not result["success"]:
-            continue
-
-        all_messages = [w["message"] for w in result["warnings"]] + [
-            e["message"] for e in result["errors"]
-        ]
-
-        for message in all_messages:
-            message_lower = message.lower()
-
-            if "concept set" in message_lower and "not used" in message_lower:
-                categories["unused_concepts"] += 1
-            elif "empty" in message_lower and (
-                "value" in message_lower
-                or "start" in message_lower
-                or "end" in message_lower
-            ):
-                categories["empty_values"] += 1
-            elif "duplicate" in message_lower or "same concepts" in message_lower:
-                categories["duplicates"] += 1
-            elif "contradiction" in message_lower or "contradictory" in message_lower:
-                categories["contradictions"] += 1
-            elif "time" in message_lower and "window" in message_lower:
-                categories["time_windows"] += 1
-            elif "domain" in message_lower and "type" in message_lower:
-                categories["domain_types"] += 1
-            elif (
-                "no concept set specified" in message_lower
-                or "empty" in message_lower
-                and "criteria" in message_lower
-            ):
-                categories["missing_criteria"] += 1
-            else:
-                categories["other"] += 1
-
-    return categories
+def categorize_message(message: str) -> str:
+    """Return the category of a single validation message."""
+    message_lower = message.lower()
+
+    if "concept set" in message_lower and "not used" in message_lower:
+        return "unused_concepts"
+    elif "empty" in message_lower and (
+        "value" in message_lower or "start" in message_lower or "end" in message_lower
+    ):
+        return "empty_values"
+    elif "duplicate" in message_lower or "same concepts" in message_lower:
+        return "duplicates"
+    elif "contradiction" in message_lower or "contradictory" in message_lower:
+        return "contradictions"
+    elif "time" in message_lower and "window" in message_lower:
+        return "time_windows"
+    elif "domain" in message_lower and "type" in message_lower:
+        return "domain_types"
+    elif (
+        "no concept set specified" in message_lower
+        or "empty" in message_lower
+        and "criteria" in message_lower
+    ):
+        return "missing_criteria"
+    return "other"
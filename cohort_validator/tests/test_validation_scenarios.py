@@ -6,19 +6,98 @@ This script tests specific validation scenarios using CIRCE test files
 to ensure different types of validation rules are working correctly.
 """
 
-import json
-import os
-from typing import Any, Dict, List
-
-from cohort_validator import CohortValidator
-
-
-def test_validation_scenario(
-    validator: CohortValidator,
+import itertools
+import sys
+from enum import IntFlag
+from typing import TYPE_CHECKING, List
+
+from _cases import ALL_CASES, ScenarioResult
+from _shared import PRESENT_FILES, get_validator, read_cohort_json, validate_files
+
+if TYPE_CHECKING:
+    from cohort_validator import CohortValidator
+
+
+class ValidationType(IntFlag):
+    """Validation types a message can report, one bit each."""
+
+    UNUSED_CONCEPTS = 1
+    EMPTY_VALUES = 2
+    DUPLICATES = 4
+    CONTRADICTIONS = 8
+    TIME_WINDOWS = 16
+    DOMAIN_TYPES = 32
+    RANGE_VALIDATION = 64
+    MISSING_CRITERIA = 128
+    EXIT_CRITERIA = 256
+    EVENTS_PROGRESSION = 512
+
+
+NO_VALIDATION_TYPES = ValidationType(0)
+
+
+def validation_type_names(flags: ValidationType) -> List[str]:
+    """Return the names (e.g. 'unused_concepts') of the types set in flags."""
+    return [t.name.lower() for t in ValidationType if flags & t]
+
+
+def classify_message(message: str) -> ValidationType:
+    """Return the validation type a message reports, or no flags if unknown."""
+    message_lower = message.lower()
+
+    if ("concept set" in message_lower and "not used" in message_lower) or (
+        "unused" in message_lower and "concept" in message_lower
+    ):
+        return ValidationType.UNUSED_CONCEPTS
+    elif "empty" in message_lower and (
+        "value" in message_lower or "start" in message_lower or "end" in message_lower
+    ):
+        return ValidationType.EMPTY_VALUES
+    elif "duplicate" in message_lower or "same concepts" in message_lower:
+        return ValidationType.DUPLICATES
+    elif "contradiction" in message_lower or "contradictory" in message_lower:
+        return ValidationType.CONTRADICTIONS
+    elif (
+        ("time" in message_lower and "window" in message_lower)
+        or ("time pattern" in message_lower)
+        or ("death time" in message_lower)
+    ):
+        return ValidationType.TIME_WINDOWS
+    elif ("domain" in message_lower and "type" in message_lower) or (
+        "drug domain" in message_lower
+    ):
+        return ValidationType.DOMAIN_TYPES
+    elif (
+        "range" in message_lower
+        and ("start" in message_lower or "end" in message_lower)
+    ) or (
+        "start" in message_lower
+        and "greater than" in message_lower
+        and "end" in message_lower
+    ):
+        return ValidationType.RANGE_VALIDATION
+    elif (
+        ("no concept set specified" in message_lower)
+        or (
+            "empty" in message_lower
+            and ("criteria" in message_lower or "rules" in message_lower)
+        )
+        or ("criteria" in message_lower and "specified" in message_lower)
+    ):
+        return ValidationType.MISSING_CRITERIA
+    elif "exit criteria" in message_lower:
+        return ValidationType.EXIT_CRITERIA
+    elif "progression" in message_lower:
+        return ValidationType.EVENTS_PROGRESSION
+    return NO_VALIDATION_TYPES
+
+
+def check_validation_scenario(
+    validator: "CohortValidator",
     test_name: str,
     test_file: str,
     expected_validation_types: List[str] = None,
-) -> Dict[str, Any]:
+) -> ScenarioResult:
     """
     Test a specific validation scenario.
 
@@ -29,141 +108,74 @@ def test_validation_scenario(
         expected_validation_types: List of expected validation types (e.g., ['unused_concepts', 'empty_values'])
 
     Returns:
-        Dictionary with test results
+        The test result
     """
-    result = {
-        "name": test_name,
-        "file": test_file,
-        "passed": False,
-        "warnings": [],
-        "errors": [],
-        "validation_types_found": set(),
-        "expected_types": expected_validation_types or [],
-        "error_message": None,
-    }
+    result = ScenarioResult(test_name, test_file, expected_validation_types or [])
 
     try:
-        if not os.path.exists(test_file):
-            result["error_message"] = f"Test file not found: {test_file}"
+        if test_file not in PRESENT_FILES:
+            result.error_message = f"Test file not found: {test_file}"
             return result
 
-        warnings, errors = validator.validate_cohort_file(test_file)
-        result["warnings"] = warnings
-        result["errors"] = errors
+        warnings, errors = validator.validate_cohort(read_cohort_json(test_file))
+        result.warnings = warnings
+        result.errors = errors
 
         # Extract validation types from messages
-        all_messages = [w["message"] for w in warnings] + [e["message"] for e in errors]
-        for message in all_messages:
-            message_lower = message.lower()
-
-            # Unused concepts validation
-            if ("concept set" in message_lower and "not used" in message_lower) or (
-                "unused" in message_lower and "concept" in message_lower
-            ):
-                result["validation_types_found"].add("unused_concepts")
-
-            # Empty values validation
-            elif "empty" in message_lower and (
-                "value" in message_lower
-                or "start" in message_lower
-                or "end" in message_lower
-            ):
-                result["validation_types_found"].add("empty_values")
-
-            # Duplicates validation
-            elif (
-                "duplicate" in message_lower
-                or "same concepts" in message_lower
-                or "duplicates" in message_lower
-                or "probably" in message_lower
-                and "duplicates" in message_lower
-            ):
-                result["validation_types_found"].add("duplicates")
-
-            # Contradictions validation
-            elif "contradiction" in message_lower or "contradictory" in message_lower:
-                result["validation_types_found"].add("contradictions")
-
-            # Time windows validation
-            elif (
-                ("time" in message_lower and "window" in message_lower)
-                or ("time pattern" in message_lower)
-                or ("death time" in message_lower)
-            ):
-                result["validation_types_found"].add("time_windows")
-
-            # Domain types validation
-            elif ("domain" in message_lower and "type" in message_lower) or (
-                "drug domain" in message_lower
-            ):
-                result["validation_types_found"].add("domain_types")
-
-            # Range validation
-            elif (
-                "range" in message_lower
-                and ("start" in message_lower or "end" in message_lower)
-            ) or (
-                "start" in message_lower
-                and "greater than" in message_lower
-                and "end" in message_lower
-            ):
-                result["validation_types_found"].add("range_validation")
-
-            # Missing criteria validation
-            elif (
-                ("no concept set specified" in message_lower)
-                or (
-                    "empty" in message_lower
-                    and ("criteria" in message_lower or "rules" in message_lower)
-                )
-                or ("criteria" in message_lower and "specified" in message_lower)
-            ):
-                result["validation_types_found"].add("missing_criteria")
-
-            # Exit criteria validation
-            elif "exit criteria" in message_lower:
-                result["validation_types_found"].add("exit_criteria")
-
-            # Events progression validation
-            elif (
-                "events progression" in message_lower or "progression" in message_lower
-            ):
-                result["validation_types_found"].add("events_progression")
+        found = NO_VALIDATION_TYPES
+        for entry in itertools.chain(warnings, errors):
+            found |= classify_message(entry["message"])
+        result.validation_types_found = found
 
         # Check if expected validation types were found
         if expected_validation_types:
-            found_expected = any(
-                t in result["validation_types_found"] for t in expected_validation_types
-            )
-            result["passed"] = found_expected
+            expected = NO_VALIDATION_TYPES
+            for t in expected_validation_types:
+                expected |= ValidationType[t.upper()]
+            found_expected = bool(found & expected)
+            result.passed = found_expected
             if not found_expected:
-                result["error_message"] = (
-                    f"Expected validation types {expected_validation_types} not found. Found: {list(result['validation_types_found'])}"
-                )
+                result.error_message = f"Expected validation types {expected_validation_types} not found. Found: {validation_type_names(found)}"
         else:
             # If no specific types expected, just check that validation ran successfully
-            result["passed"] = True
+            result.passed = True
 
     except Exception as e:
-        result["error_message"] = f"Test failed with exception: {e}"
+        result.error_message = f"Test failed with exception: {e}"
 
     return result
 
 
-def test_unused_concepts_validation(validator: CohortValidator) -> List[Dict[str, Any]]:
-    """Test unused concepts validation."""
-    print("\n" + "=" * 50)
-    print("TESTING UNUSED CONCEPTS VALIDATION")
-    print("=" * 50)
+def print_scenario_results(title: str, tests: List[ScenarioResult]):
+    """Print the results of a group of scenarios with a single write."""
+    lines = ["\n" + "=" * 50, title, "=" * 50]
+    for test in tests:
+        status = "✅ PASSED" if test.passed else "❌ FAILED"
+        lines.append(f"{test.name}: {status}")
+        lines.append(f"  Warnings: {len(test.warnings)}, Errors: {len(test.errors)}")
+        lines.append(
+            f"  Validation types found: {validation_type_names(test.validation_types_found)}"
+        )
+        if test.error_message:
+            lines.append(f"  Error: {test.error_message}")
+        lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 
+def check_unused_concepts_validation(
+    validator: "CohortValidator",
+) -> List[ScenarioResult]:
+    """Test unused concepts validation."""
     tests = [
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Unused Concept Set",
             "circe-be/src/test/resources/checkers/unusedConceptSet.json",
             ["unused_concepts"],
         ),
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Unused Concept Set Correct",
             "circe-be/src/test/resources/checkers/unusedConceptSetCorrect.json",
@@ -171,32 +183,21 @@ def test_unused_concepts_validation(validator: CohortValidator) -> List[Dict[str
         ),
     ]
 
-    for test in tests:
-        status = "✅ PASSED" if test["passed"] else "❌ FAILED"
-        print(f"{test['name']}: {status}")
-        print(f"  Warnings: {len(test['warnings'])}, Errors: {len(test['errors'])}")
-        print(f"  Validation types found: {list(test['validation_types_found'])}")
-        if test["error_message"]:
-            print(f"  Error: {test['error_message']}")
-        print()
+    print_scenario_results("TESTING UNUSED CONCEPTS VALIDATION", tests)
 
     return tests
 
 
-def test_empty_values_validation(validator: CohortValidator) -> List[Dict[str, Any]]:
+def check_empty_values_validation(validator: "CohortValidator") -> List[ScenarioResult]:
     """Test empty values validation."""
-    print("\n" + "=" * 50)
-    print("TESTING EMPTY VALUES VALIDATION")
-    print("=" * 50)
-
     tests = [
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Primary Criteria with Empty Values",
             "circe-be/src/test/resources/checkers/primaryCriteriaCheckValueIncorrect.json",
             ["empty_values"],
         ),
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Additional Criteria with Empty Values",
             "circe-be/src/test/resources/checkers/additionalCriteriaCheckValueIncorrect.json",
@@ -204,38 +205,27 @@ def test_empty_values_validation(validator: CohortValidator) -> List[Dict[str, A
         ),
     ]
 
-    for test in tests:
-        status = "✅ PASSED" if test["passed"] else "❌ FAILED"
-        print(f"{test['name']}: {status}")
-        print(f"  Warnings: {len(test['warnings'])}, Errors: {len(test['errors'])}")
-        print(f"  Validation types found: {list(test['validation_types_found'])}")
-        if test["error_message"]:
-            print(f"  Error: {test['error_message']}")
-        print()
+    print_scenario_results("TESTING EMPTY VALUES VALIDATION", tests)
 
     return tests
 
 
-def test_duplicates_validation(validator: CohortValidator) -> List[Dict[str, Any]]:
+def check_duplicates_validation(validator: "CohortValidator") -> List[ScenarioResult]:
     """Test duplicates validation."""
-    print("\n" + "=" * 50)
-    print("TESTING DUPLICATES VALIDATION")
-    print("=" * 50)
-
     tests = [
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Duplicate Concept Sets",
             "circe-be/src/test/resources/checkers/duplicatesConceptSetCheckIncorrect.json",
             ["duplicates"],
         ),
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Duplicate Criteria",
             "circe-be/src/test/resources/checkers/duplicatesCriteriaCheckIncorrect.json",
             ["duplicates"],
         ),
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Concept Set with Duplicate Items",
             "circe-be/src/test/resources/checkers/conceptSetWithDuplicateItems.json",
@@ -243,32 +233,21 @@ def test_duplicates_validation(validator: CohortValidator) -> List[Dict[str, Any
         ),
     ]
 
-    for test in tests:
-        status = "✅ PASSED" if test["passed"] else "❌ FAILED"
-        print(f"{test['name']}: {status}")
-        print(f"  Warnings: {len(test['warnings'])}, Errors: {len(test['errors'])}")
-        print(f"  Validation types found: {list(test['validation_types_found'])}")
-        if test["error_message"]:
-            print(f"  Error: {test['error_message']}")
-        print()
+    print_scenario_results("TESTING DUPLICATES VALIDATION", tests)
 
     return tests
 
 
-def test_domain_validation(validator: CohortValidator) -> List[Dict[str, Any]]:
+def check_domain_validation(validator: "CohortValidator") -> List[ScenarioResult]:
     """Test domain and type validation."""
-    print("\n" + "=" * 50)
-    print("TESTING DOMAIN AND TYPE VALIDATION")
-    print("=" * 50)
-
     tests = [
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Domain Type Incorrect",
             "circe-be/src/test/resources/checkers/domainTypeCheckIncorrect.json",
             ["domain_types"],
         ),
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Drug Domain Incorrect",
             "circe-be/src/test/resources/checkers/drugDomainCheckIncorrect.json",
@@ -276,32 +255,21 @@ def test_domain_validation(validator: CohortValidator) -> List[Dict[str, Any]]:
         ),
     ]
 
-    for test in tests:
-        status = "✅ PASSED" if test["passed"] else "❌ FAILED"
-        print(f"{test['name']}: {status}")
-        print(f"  Warnings: {len(test['warnings'])}, Errors: {len(test['errors'])}")
-        print(f"  Validation types found: {list(test['validation_types_found'])}")
-        if test["error_message"]:
-            print(f"  Error: {test['error_message']}")
-        print()
+    print_scenario_results("TESTING DOMAIN AND TYPE VALIDATION", tests)
 
     return tests
 
 
-def test_time_validation(validator: CohortValidator) -> List[Dict[str, Any]]:
+def check_time_validation(validator: "CohortValidator") -> List[ScenarioResult]:
     """Test time-related validation."""
-    print("\n" + "=" * 50)
-    print("TESTING TIME-RELATED VALIDATION")
-    print("=" * 50)
-
     tests = [
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Death Time Window Incorrect",
             "circe-be/src/test/resources/checkers/deathTimeWindowCheckIncorrect.json",
             ["time_windows"],
         ),
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Time Pattern Incorrect",
             "circe-be/src/test/resources/checkers/timePatternCheckIncorrect.json",
@@ -309,26 +277,17 @@ def test_time_validation(validator: CohortValidator) -> List[Dict[str, Any]]:
         ),
     ]
 
-    for test in tests:
-        status = "✅ PASSED" if test["passed"] else "❌ FAILED"
-        print(f"{test['name']}: {status}")
-        print(f"  Warnings: {len(test['warnings'])}, Errors: {len(test['errors'])}")
-        print(f"  Validation types found: {list(test['validation_types_found'])}")
-        if test["error_message"]:
-            print(f"  Error: {test['error_message']}")
-        print()
+    print_scenario_results("TESTING TIME-RELATED VALIDATION", tests)
 
     return tests
 
 
-def test_contradictions_validation(validator: CohortValidator) -> List[Dict[str, Any]]:
+def check_contradictions_validation(
+    validator: "CohortValidator",
+) -> List[ScenarioResult]:
     """Test contradictions validation."""
-    print("\n" + "=" * 50)
-    print("TESTING CONTRADICTIONS VALIDATION")
-    print("=" * 50)
-
     tests = [
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Contradictions Criteria Incorrect",
             "circe-be/src/test/resources/checkers/contradictionsCriteriaCheckIncorrect.json",
@@ -336,40 +295,29 @@ def test_contradictions_validation(validator: CohortValidator) -> List[Dict[str,
         )
     ]
 
-    for test in tests:
-        status = "✅ PASSED" if test["passed"] else "❌ FAILED"
-        print(f"{test['name']}: {status}")
-        print(f"  Warnings: {len(test['warnings'])}, Errors: {len(test['errors'])}")
-        print(f"  Validation types found: {list(test['validation_types_found'])}")
-        if test["error_message"]:
-            print(f"  Error: {test['error_message']}")
-        print()
+    print_scenario_results("TESTING CONTRADICTIONS VALIDATION", tests)
 
     return tests
 
 
-def test_missing_criteria_validation(
-    validator: CohortValidator,
-) -> List[Dict[str, Any]]:
+def check_missing_criteria_validation(
+    validator: "CohortValidator",
+) -> List[ScenarioResult]:
     """Test missing criteria validation."""
-    print("\n" + "=" * 50)
-    print("TESTING MISSING CRITERIA VALIDATION")
-    print("=" * 50)
-
     tests = [
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Empty Primary Criteria List",
             "circe-be/src/test/resources/checkers/emptyPrimaryCriteriaList.json",
             ["missing_criteria"],
         ),
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Empty Inclusion Rules",
             "circe-be/src/test/resources/checkers/emptyInclusionRules.json",
             ["missing_criteria"],
         ),
-        test_validation_scenario(
+        check_validation_scenario(
             validator,
             "Empty Correlated Criteria",
             "circe-be/src/test/resources/checkers/emptyCorrelatedCriteria.json",
@@ -377,19 +325,12 @@ def test_missing_criteria_validation(
         ),
     ]
 
-    for test in tests:
-        status = "✅ PASSED" if test["passed"] else "❌ FAILED"
-        print(f"{test['name']}: {status}")
-        print(f"  Warnings: {len(test['warnings'])}, Errors: {len(test['errors'])}")
-        print(f"  Validation types found: {list(test['validation_types_found'])}")
-        if test["error_message"]:
-            print(f"  Error: {test['error_message']}")
-        print()
+    print_scenario_results("TESTING MISSING CRITERIA VALIDATION", tests)
 
     return tests
 
 
-def print_validation_summary(all_tests: List[List[Dict[str, Any]]]):
+def print_validation_summary(all_tests: List[List[ScenarioResult]]):
     """Print a summary of validation scenario tests."""
     print("\n" + "=" * 80)
     print("VALIDATION SCENARIO TEST SUMMARY")
@@ -397,20 +338,22 @@ def print_validation_summary(all_tests: List[List[Dict[str, Any]]]):
 
     total_tests = 0
     total_passed = 0
-    validation_types_tested = set()
+    validation_types_tested = NO_VALIDATION_TYPES
 
     for test_group in all_tests:
         for test in test_group:
             total_tests += 1
-            if test["passed"]:
+            if test.passed:
                 total_passed += 1
-            validation_types_tested.update(test["validation_types_found"])
+            validation_types_tested |= test.validation_types_found
 
     print(f"Total Tests: {total_tests}")
     print(f"Passed: {total_passed}")
     print(f"Failed: {total_tests - total_passed}")
     print(f"Success Rate: {total_passed/total_tests*100:.1f}%")
-    print(f"Validation Types Tested: {sorted(validation_types_tested)}")
+    print(
+        f"Validation Types Tested: {sorted(validation_type_names(validation_types_tested))}"
+    )
 
     if total_passed == total_tests:
         print("\n🎉 All validation scenarios passed!")
@@ -424,26 +367,30 @@ def main():
     print("=" * 80)
     print("Testing specific validation scenarios...")
 
-    validator = CohortValidator()
+    validator = get_validator()
 
     try:
+        # Most scenario files are shared test cases; validating them in one
+        # batch leaves only cache lookups for the scenarios
+        validate_files(validator, ALL_CASES)
+
         all_tests = []
 
         # Test different validation scenarios
-        all_tests.append(test_unused_concepts_validation(validator))
-        all_tests.append(test_empty_values_validation(validator))
-        all_tests.append(test_duplicates_validation(validator))
-        all_tests.append(test_domain_validation(validator))
-        all_tests.append(test_time_validation(validator))
-        all_tests.append(test_contradictions_validation(validator))
-        all_tests.append(test_missing_criteria_validation(validator))
+        all_tests.append(check_unused_concepts_validation(validator))
+        all_tests.append(check_empty_values_validation(validator))
+        all_tests.append(check_duplicates_validation(validator))
+        all_tests.append(check_domain_validation(validator))
+        all_tests.append(check_time_validation(validator))
+        all_tests.append(check_contradictions_validation(validator))
+        all_tests.append(check_missing_criteria_validation(validator))
 
         # Print summary
         print_validation_summary(all_tests)
 
     finally:
-        validator.shutdown()
-        print("\nValidator shutdown complete.")
+        # Let a later run in the same interpreter see edited test files
+        read_cohort_json.cache_clear()
 
 
 if __name__ == "__main__":
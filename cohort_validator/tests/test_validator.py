@@ -1,14 +1,22 @@
-#!/usr/bin/env python3
 """
-Test script for the CohortValidator.
+Tests for the CohortValidator.
 
-This script tests the cohort validation functionality with sample data.
+These tests check the cohort validation functionality with sample data,
+using the session's shared validator.
 """
 
-import json
+import hashlib
 import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from cohort_validator import CohortValidator
+import orjson
+import pytest
+
+if TYPE_CHECKING:
+    from cohort_validator import CohortValidator
 
 
 def create_sample_cohort():
@@ -72,14 +80,17 @@ def create_sample_cohort():
     }
 
 
-def test_valid_cohort():
+# Validation does not modify its input, so tests share one sample cohort
+SAMPLE_COHORT = create_sample_cohort()
+# The sample as JSON, for the tests that write it to a file
+SAMPLE_COHORT_JSON = orjson.dumps(SAMPLE_COHORT)
+
+
+def test_valid_cohort(validator: "CohortValidator"):
     """Test validation with a valid cohort."""
     print("Testing valid cohort...")
 
-    validator = CohortValidator()
-    cohort_data = create_sample_cohort()
-
-    warnings, errors = validator.validate_cohort(cohort_data)
+    warnings, errors = validator.validate_cohort(SAMPLE_COHORT)
 
     print(f"Warnings: {len(warnings)}")
     print(f"Errors: {len(errors)}")
@@ -94,16 +105,13 @@ def test_valid_cohort():
         for error in errors:
             print(f"  - {error['message']}")
 
-    # Don't shutdown here - we'll use the same validator for other tests
     assert len(errors) == 0
 
 
-def test_invalid_json():
+def test_invalid_json(validator: "CohortValidator"):
     """Test validation with invalid JSON."""
     print("\nTesting invalid JSON...")
 
-    validator = CohortValidator()
-
     invalid_json = {"invalid": "json structure"}
 
     warnings, errors = validator.validate_cohort(invalid_json)
@@ -119,92 +127,300 @@ def test_invalid_json():
     assert len(errors) > 0
 
 
-def test_file_validation():
+def test_file_validation(validator: "CohortValidator", tmp_path: Path):
     """Test validation from a file."""
     print("\nTesting file validation...")
 
-    validator = CohortValidator()
+    test_file = tmp_path / "test_cohort.json"
+    test_file.write_bytes(SAMPLE_COHORT_JSON)
+
+    warnings, errors = validator.validate_cohort_file(str(test_file))
+
+    print(f"Warnings: {len(warnings)}")
+    print(f"Errors: {len(errors)}")
+
+    assert len(errors) == 0
+
+
+def test_repeated_validation_is_cached(validator: "CohortValidator", monkeypatch):
+    """Test that validating the same cohort twice uses the cached result."""
+    print("\nTesting cached validation...")
+
+    first = validator.validate_cohort(SAMPLE_COHORT)
+    cache_key = hashlib.blake2b(validator._encode(SAMPLE_COHORT)).digest()
+    assert cache_key in validator._cache
+
+    def not_validated(*args):
+        raise AssertionError("cached cohort validated again")
+
+    # Neither the JVM nor a validation server may be asked again
+    monkeypatch.setattr(validator, "_read_value", not_validated)
+    monkeypatch.setattr(validator, "_request_validation", not_validated)
+
+    # An equal but separately built expression
+    second = validator.validate_cohort(create_sample_cohort())
+
+    assert first == second
+
+
+def test_batch_validation(validator: "CohortValidator"):
+    """Test validation of several cohorts in one batch."""
+    print("\nTesting batch validation...")
+
+    results = validator.validate_cohorts([SAMPLE_COHORT, {"invalid": "json structure"}])
+
+    print(f"Results: {len(results)}")
+
+    assert len(results) == 2
+    assert len(results[0][1]) == 0
+    assert len(results[1][1]) > 0
+
+
+def test_batch_file_validation(validator: "CohortValidator", tmp_path: Path):
+    """Test validation of several files in one batch."""
+    print("\nTesting batch file validation...")
+
+    test_file = tmp_path / "test_cohort_batch.json"
+    test_file.write_bytes(SAMPLE_COHORT_JSON)
+
+    results = validator.validate_cohort_files(
+        [str(test_file), str(tmp_path / "missing_cohort.json")]
+    )
+
+    print(f"Results: {len(results)}")
+
+    assert len(results) == 2
+    assert len(results[0][1]) == 0
+    assert results[1][1][0]["type"] == "FILE_ERROR"
+
+
+def test_batch_repeats_and_cache(validator: "CohortValidator", monkeypatch):
+    """Test that a batch validates repeated expressions once and caches them."""
+    print("\nTesting repeated expressions in a batch...")
+
+    # A title of its own, so no earlier test has cached this expression
+    cohort = dict(SAMPLE_COHORT, Title="Repeated in a batch")
+    sent = []
+
+    # Record the expressions sent to the JVM, or to a validation server
+    read_value = validator._read_value
+    request_validations = validator._request_validations
+
+    def recording_read_value(payload, java_class):
+        sent.extend(orjson.loads(payload))
+        return read_value(payload, java_class)
+
+    def recording_request_validations(payloads):
+        sent.extend(payloads)
+        return request_validations(payloads)
+
+    monkeypatch.setattr(validator, "_read_value", recording_read_value)
+    monkeypatch.setattr(
+        validator, "_request_validations", recording_request_validations
+    )
+
+    results = validator.validate_cohorts([cohort, cohort])
+
+    assert len(sent) == 1
+    assert results[0] == results[1]
+    assert results[0][0] is not results[1][0]
+    assert hashlib.blake2b(validator._encode(cohort)).digest() in validator._cache
+    assert validator.validate_cohort(cohort) == results[0]
+    assert len(sent) == 1
+
+
+def test_batch_detaches_worker_threads(validator: "CohortValidator"):
+    """Test that batch validation leaves no worker threads attached to the JVM."""
+    print("\nTesting worker threads of a batch...")
+
+    if validator._socket_path is not None:
+        pytest.skip("the checks run in the validation server")
+
+    import jpype
+
+    thread_class = jpype.JClass("java.lang.Thread")
+    java_threads = thread_class.getAllStackTraces().size()
+
+    results = validator.validate_cohorts(
+        [dict(SAMPLE_COHORT, Title=f"Worker threads {i}") for i in range(8)],
+        max_workers=4,
+    )
+
+    assert all(len(errors) == 0 for _, errors in results)
+    assert thread_class.getAllStackTraces().size() == java_threads
+
+
+def test_batch_text_with_several_expressions(validator: "CohortValidator"):
+    """Test that JSON text holding two expressions does not shift results."""
+    print("\nTesting JSON text with several expressions...")
+
+    first = dict(SAMPLE_COHORT, Title="Batch text first")
+    second = dict(SAMPLE_COHORT, Title="Batch text second")
+    # Without ConceptSets the Checker fails, so this result is easy to tell
+    # apart from the results of the sample
+    broken = dict(SAMPLE_COHORT, Title="Batch text broken")
+    del broken["ConceptSets"]
+
+    two_expressions = orjson.dumps(first) + b"," + orjson.dumps(second)
+
+    results = validator.validate_cohorts([two_expressions, orjson.dumps(broken)])
+
+    assert len(results) == 2
+    assert results[0] == validator.validate_cohort(two_expressions)
+    assert [error["type"] for error in results[1][1]] == ["VALIDATION_ERROR"]
+
+
+# Starts the JVM from pool threads in a fresh process: eight first
+# validations at once, then a shutdown that must return
+_POOL_START_SCRIPT = """
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+
+from cohort_validator import CohortValidator
+
+cohort = orjson.loads(sys.argv[1])
+validator = CohortValidator()
+with ThreadPoolExecutor(max_workers=8) as pool:
+    results = list(
+        pool.map(
+            validator.validate_cohort,
+            [dict(cohort, Title=f"Pool start {i}") for i in range(8)],
+        )
+    )
+print(orjson.dumps(results).decode())
+validator.shutdown()
+"""
+
+
+def test_jvm_start_on_pool_threads():
+    """Test starting the JVM from pool threads, and shutting it down after."""
+    print("\nTesting a JVM started on pool threads...")
+
+    completed = subprocess.run(
+        [sys.executable, "-c", _POOL_START_SCRIPT, SAMPLE_COHORT_JSON.decode()],
+        env=dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[2])),
+        capture_output=True,
+        check=True,
+        timeout=60,
+    )
+
+    results = orjson.loads(completed.stdout)
+    assert [errors for _, errors in results] == [[]] * 8
+
+
+def test_results_are_copies(monkeypatch):
+    """Test that changing a returned result does not change the cached one."""
+    from cohort_validator import CohortValidator
+
+    def result():
+        return [{"message": "Checked", "severity": "WARNING", "type": "TEST"}], []
+
+    # Answered without a JVM or a server behind the socket
+    validator = CohortValidator(socket_path="unused.sock")
+    monkeypatch.setattr(validator, "_request_validation", lambda payload: result())
+    monkeypatch.setattr(
+        validator, "_request_validations", lambda payloads: [result()] * len(payloads)
+    )
+
+    warnings, _ = validator.validate_cohort(SAMPLE_COHORT)
+    warnings[0]["message"] = "Changed"
+    warnings, _ = validator.validate_cohort(SAMPLE_COHORT)
+    assert warnings[0]["message"] == "Checked"
+
+    # Cached, and repeated within a batch
+    other = dict(SAMPLE_COHORT, Title="Other")
+    results = validator.validate_cohorts([SAMPLE_COHORT, other, other])
+    for warnings, _ in results:
+        warnings[0]["message"] = "Changed"
+    for warnings, _ in validator.validate_cohorts([SAMPLE_COHORT, other]):
+        assert warnings[0]["message"] == "Checked"
+
+
+def test_only_the_starting_validator_warns(monkeypatch, caplog):
+    """Test that only the validator that started the JVM warns when discarded."""
+    import jpype
+
+    from cohort_validator import CohortValidator
+
+    jvm_running = [True]
+    monkeypatch.setattr(jpype, "isJVMStarted", lambda: jvm_running[0])
+    monkeypatch.setattr(
+        jpype, "startJVM", lambda *args, **kwargs: jvm_running.__setitem__(0, True)
+    )
+
+    # The JVM is already running, as when another validator started it
+    joining = CohortValidator()
+    joining._start_jvm()
+    joining.__del__()
+    assert not caplog.records
+
+    jvm_running[0] = False
+    starting = CohortValidator()
+    starting._start_jvm()
+    starting.__del__()
+    assert [record.levelname for record in caplog.records] == ["WARNING"]
+
+    # Keep the real __del__ quiet once the patches are undone
+    starting._jvm_started = False
+
+
+def test_classpath_cache(tmp_path: Path, monkeypatch):
+    """Test that the dependency listing is cached until the directory changes."""
+    from cohort_validator import CohortValidator
+    from cohort_validator import cohort_validator as module
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    deps = tmp_path / "dependencies"
+    deps.mkdir()
+    (deps / "a.jar").touch()
+    validator = CohortValidator(jar_path="circe.jar", deps_path=str(deps))
+
+    # Miss: the directory is listed and the listing written to the cache
+    classpath = validator._build_classpath()
+    assert classpath == os.pathsep.join(["circe.jar", str(deps / "a.jar")])
+    assert os.listdir(module._cache_dir()) == ["classpath.txt"]
+
+    # Hit: the directory is not listed again
+    with monkeypatch.context() as patched:
+        patched.setattr(module.glob, "glob", None)
+        assert validator._build_classpath() == classpath
+
+    # Invalidation: a new JAR changes the modification time of the directory
+    (deps / "b.jar").touch()
+    mtime_ns = os.stat(deps).st_mtime_ns + 1_000_000_000
+    os.utime(deps, ns=(mtime_ns, mtime_ns))
+    assert validator._build_classpath() == os.pathsep.join(
+        ["circe.jar", str(deps / "a.jar"), str(deps / "b.jar")]
+    )
+
+
+def test_missing_primary_criteria(validator: "CohortValidator"):
+    """Test that expressions without PrimaryCriteria are rejected up front."""
+    print("\nTesting missing PrimaryCriteria...")
+
+    warnings, errors = validator.validate_cohort({"ConceptSets": []})
+
+    print(f"Errors: {len(errors)}")
+
+    assert len(warnings) == 0
+    assert [error["type"] for error in errors] == ["SCHEMA_ERROR"]
+
+
+def test_missing_concept_sets(validator: "CohortValidator"):
+    """Test that expressions without ConceptSets are rejected up front."""
+    print("\nTesting missing ConceptSets...")
 
-    # Create a temporary test file
-    test_file = "test_cohort.json"
     cohort_data = create_sample_cohort()
+    del cohort_data["ConceptSets"]
+    del cohort_data["InclusionRules"]
+
+    warnings, errors = validator.validate_cohort(cohort_data)
+
+    print(f"Errors: {len(errors)}")
 
-    with open(test_file, "w") as f:
-        json.dump(cohort_data, f, indent=2)
-
-    try:
-        with open(test_file, "r") as f:
-            cohort_data = json.load(f)
-
-        warnings, errors = validator.validate_cohort(cohort_data)
-
-        print(f"Warnings: {len(warnings)}")
-        print(f"Errors: {len(errors)}")
-
-        assert len(errors) == 0
-    finally:
-        # Clean up test file
-        if os.path.exists(test_file):
-            os.remove(test_file)
-
-
-def main():
-    """Run all tests."""
-    print("Cohort Validator Test Suite")
-    print("=" * 40)
-
-    results = []
-    validator = None
-
-    try:
-        # Test 1: Valid Cohort
-        try:
-            result, validator = test_valid_cohort()
-            results.append(("Valid Cohort", result, None))
-            print(f"✓ Valid Cohort: {'PASSED' if result else 'FAILED'}")
-        except Exception as e:
-            results.append(("Valid Cohort", False, str(e)))
-            print(f"✗ Valid Cohort: FAILED - {e}")
-
-        # Test 2: Invalid JSON (using same validator)
-        if validator:
-            try:
-                result = test_invalid_json(validator)
-                results.append(("Invalid JSON", result, None))
-                print(f"✓ Invalid JSON: {'PASSED' if result else 'FAILED'}")
-            except Exception as e:
-                results.append(("Invalid JSON", False, str(e)))
-                print(f"✗ Invalid JSON: FAILED - {e}")
-
-        # Test 3: File Validation (using same validator)
-        if validator:
-            try:
-                result = test_file_validation(validator)
-                results.append(("File Validation", result, None))
-                print(f"✓ File Validation: {'PASSED' if result else 'FAILED'}")
-            except Exception as e:
-                results.append(("File Validation", False, str(e)))
-                print(f"✗ File Validation: FAILED - {e}")
-
-    finally:
-        # Clean up validator
-        if validator:
-            validator.shutdown()
-
-    print("\n" + "=" * 40)
-    print("Test Summary:")
-    passed = sum(1 for _, result, _ in results if result)
-    total = len(results)
-    print(f"Passed: {passed}/{total}")
-
-    if passed == total:
-        print("All tests passed! 🎉")
-    else:
-        print("Some tests failed. Check the output above.")
-        for test_name, result, error in results:
-            if not result:
-                print(f"  - {test_name}: {error or 'Failed'}")
-
-
-if __name__ == "__main__":
-    main()
+    assert len(warnings) == 0
+    assert [error["message"] for error in errors] == [
+        "Cohort expression has no ConceptSets"
+    ]